@@ -1,6 +1,7 @@
 package main
 
 import (
+	"context"
 	"github.com/zuchzub/Go/pkg"
 	"github.com/zuchzub/Go/pkg/config"
 	"github.com/zuchzub/Go/pkg/core/db"
@@ -9,9 +10,11 @@ import (
 
 	"log"
 	"net/http"
+	"os"
+	"os/signal"
+	"syscall"
 	"time"
 
-	_ "net/http"
 	_ "net/http/pprof"
 
 	"github.com/Laky-64/gologging"
@@ -29,6 +32,9 @@ func handleFlood(err error) bool {
 	return false
 }
 
+// shutdownTimeout bounds how long the cleanup after an interrupt may take.
+const shutdownTimeout = 15 * time.Second
+
 //go:generate go run setup_ntgcalls.go static
 
 // main serves as the entry point for the application.
@@ -88,8 +94,39 @@ func main() {
 	gologging.InfoF("The bot is running as @%s.", client.Me().Username)
 	_, _ = client.SendMessage(config.Conf.LoggerId, "The bot has started!")
 
-	client.Idle()
+	// The signal context is the single owner of SIGINT/SIGTERM: main blocks on it and runs the cleanup exactly once.
+	sigCtx, stop := signal.NotifyContext(context.Background(), os.Interrupt, syscall.SIGTERM)
+	<-sigCtx.Done()
+	// Ignore further signals before stop releases them, so they never fall back to the default handler that would kill the process.
+	signal.Ignore(os.Interrupt, syscall.SIGTERM)
+	stop()
+	shutdown(client)
+}
+
+// shutdown stops the assistant clients, the bot client, and the database connection.
+// main ignores further interrupt signals before calling it, so that a repeated Ctrl-C cannot abort the cleanup half-way,
+// and the whole sequence is bounded by shutdownTimeout so that a stuck step cannot hang the process.
+func shutdown(client *tg.Client) {
 	gologging.InfoF("The bot is shutting down...")
-	vc.Calls.StopAllClients()
-	_ = client.Stop()
+
+	ctx, cancel := context.WithTimeout(context.Background(), shutdownTimeout)
+	defer cancel()
+
+	done := make(chan struct{})
+	go func() {
+		defer close(done)
+		vc.Calls.StopAllClients()
+		if err := client.Stop(); err != nil {
+			gologging.WarnF("Failed to stop the bot client: %v", err)
+		}
+		if err := db.Instance.Close(ctx); err != nil {
+			gologging.WarnF("Failed to close the database connection: %v", err)
+		}
+	}()
+
+	select {
+	case <-done:
+	case <-ctx.Done():
+		gologging.WarnF("The shutdown did not finish within %s.", shutdownTimeout)
+	}
 }
\ No newline at end of file
@@ -7,10 +7,19 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
+	"time"
 )
 
 var tmpDir = "src/cookies"
 
+// maxCookieFetches bounds how many cookie URLs saveAllCookies fetches concurrently.
+const maxCookieFetches = 5
+
+// cookieClient uses the process-wide default transport, so cookie fetches share its keep-alive pool,
+// and bounds each fetch so a stalled paste host cannot hold a worker forever.
+var cookieClient = &http.Client{Timeout: 30 * time.Second}
+
 // fetchContent downloads content from Pastebin or Batbin.
 // It takes a URL as input.
 // It returns the content of the URL as a string and an error if any.
@@ -25,7 +34,7 @@ func fetchContent(url string) (string, error) {
 		rawURL = fmt.Sprintf("https://batbin.me/raw/%s", id)
 	}
 
-	resp, err := http.Get(rawURL)
+	resp, err := cookieClient.Get(rawURL)
 	if err != nil {
 		return "", fmt.Errorf("failed to GET %s: %w", rawURL, err)
 	}
@@ -70,21 +79,39 @@ func saveContent(url, content string) (string, error) {
 }
 
 // saveAllCookies downloads all URLs and stores paths in Conf.CookiesPath.
+// Up to maxCookieFetches URLs are fetched at once; the paths keep the order of urls.
 // It takes a slice of URLs as input.
 func saveAllCookies(urls []string) {
-	for _, url := range urls {
-		content, err := fetchContent(url)
-		if err != nil {
-			fmt.Println("Error fetching:", err)
-			continue
-		}
+	paths := make([]string, len(urls))
+	sem := make(chan struct{}, maxCookieFetches)
+	var wg sync.WaitGroup
 
-		path, err := saveContent(url, content)
-		if err != nil {
-			fmt.Println("Error saving:", err)
-			continue
-		}
+	for i, url := range urls {
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(i int, url string) {
+			defer wg.Done()
+			defer func() { <-sem }()
 
-		Conf.CookiesPath = append(Conf.CookiesPath, path)
+			content, err := fetchContent(url)
+			if err != nil {
+				fmt.Println("Error fetching:", err)
+				return
+			}
+
+			path, err := saveContent(url, content)
+			if err != nil {
+				fmt.Println("Error saving:", err)
+				return
+			}
+			paths[i] = path
+		}(i, url)
+	}
+	wg.Wait()
+
+	for _, path := range paths {
+		if path != "" {
+			Conf.CookiesPath = append(Conf.CookiesPath, path)
+		}
 	}
 }
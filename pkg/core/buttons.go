@@ -42,13 +42,15 @@ var GroupBtn = telegram.Button.URL("ꜱᴜᴘᴘᴏʀᴛ", "https://t.me/GuardxS
 // SourceCodeBtn is a button that links to the source code.
 var SourceCodeBtn = telegram.Button.URL("Sᴏᴜʀᴄᴇ Cᴏᴅᴇ", "https://github.com/AshokShau/TgMusicBot")
 
-// SupportKeyboard creates and returns an inline keyboard with buttons for support and updates.
-func SupportKeyboard() *telegram.ReplyInlineMarkup {
-	keyboard := telegram.NewKeyboard().
-		AddRow(ChannelBtn, GroupBtn).
-		AddRow(CloseBtn)
+// supportKeyboard is the prebuilt markup returned by SupportKeyboard.
+var supportKeyboard = telegram.NewKeyboard().
+	AddRow(ChannelBtn, GroupBtn).
+	AddRow(CloseBtn).
+	Build()
 
-	return keyboard.Build()
+// SupportKeyboard returns an inline keyboard with buttons for support and updates.
+func SupportKeyboard() *telegram.ReplyInlineMarkup {
+	return supportKeyboard
 }
 
 // SettingsKeyboard creates an inline keyboard for bot settings
@@ -86,53 +88,57 @@ func SettingsKeyboard(playMode, adminMode string) *telegram.ReplyInlineMarkup {
 	return keyboard.Build()
 }
 
-// HelpMenuKeyboard creates and returns an inline keyboard with buttons for navigating the help menu.
-func HelpMenuKeyboard() *telegram.ReplyInlineMarkup {
-	keyboard := telegram.NewKeyboard().
-		AddRow(UserBtn, AdminBtn).
-		AddRow(OwnerBtn, DevsBtn).
-		AddRow(CloseBtn, HomeBtn)
+// helpMenuKeyboard is the prebuilt markup returned by HelpMenuKeyboard.
+var helpMenuKeyboard = telegram.NewKeyboard().
+	AddRow(UserBtn, AdminBtn).
+	AddRow(OwnerBtn, DevsBtn).
+	AddRow(CloseBtn, HomeBtn).
+	Build()
 
-	return keyboard.Build()
+// HelpMenuKeyboard returns an inline keyboard with buttons for navigating the help menu.
+func HelpMenuKeyboard() *telegram.ReplyInlineMarkup {
+	return helpMenuKeyboard
 }
 
-// BackHelpMenuKeyboard creates and returns an inline keyboard with buttons to return to the main help menu.
+// backHelpMenuKeyboard is the prebuilt markup returned by BackHelpMenuKeyboard.
+var backHelpMenuKeyboard = telegram.NewKeyboard().
+	AddRow(HelpBtn, HomeBtn).
+	AddRow(CloseBtn, SourceCodeBtn).
+	Build()
+
+// BackHelpMenuKeyboard returns an inline keyboard with buttons to return to the main help menu.
 func BackHelpMenuKeyboard() *telegram.ReplyInlineMarkup {
-	keyboard := telegram.NewKeyboard().
-		AddRow(HelpBtn, HomeBtn).
-		AddRow(CloseBtn, SourceCodeBtn)
+	return backHelpMenuKeyboard
+}
 
-	return keyboard.Build()
+var (
+	skipBtn   = telegram.Button.Data("‣‣I", "play_skip")
+	stopBtn   = telegram.Button.Data("▢", "play_stop")
+	pauseBtn  = telegram.Button.Data("II", "play_pause")
+	resumeBtn = telegram.Button.Data("▷", "play_resume")
+	muteBtn   = telegram.Button.Data("🔇", "play_mute")
+	unmuteBtn = telegram.Button.Data("🔊", "play_unmute")
+)
+
+// closeKeyboard is the markup used by ControlButtons for unknown modes.
+var closeKeyboard = telegram.NewKeyboard().AddRow(CloseBtn).Build()
+
+// controlKeyboards holds the prebuilt playback control markup for each mode accepted by ControlButtons.
+var controlKeyboards = map[string]*telegram.ReplyInlineMarkup{
+	"play":   telegram.NewKeyboard().AddRow(skipBtn, stopBtn, pauseBtn, resumeBtn).AddRow(CloseBtn).Build(),
+	"pause":  telegram.NewKeyboard().AddRow(skipBtn, stopBtn, resumeBtn).AddRow(CloseBtn).Build(),
+	"resume": telegram.NewKeyboard().AddRow(skipBtn, stopBtn, pauseBtn).AddRow(CloseBtn).Build(),
+	"mute":   telegram.NewKeyboard().AddRow(skipBtn, stopBtn, unmuteBtn).AddRow(CloseBtn).Build(),
+	"unmute": telegram.NewKeyboard().AddRow(skipBtn, stopBtn, muteBtn).AddRow(CloseBtn).Build(),
 }
 
-// ControlButtons creates and returns an inline keyboard with playback control buttons, customized based on the current mode.
+// ControlButtons returns an inline keyboard with playback control buttons, customized based on the current mode.
 // The 'mode' parameter can be "play", "pause", "resume", "mute", or "unmute" to display the relevant controls.
 func ControlButtons(mode string) *telegram.ReplyInlineMarkup {
-	skipBtn := telegram.Button.Data("‣‣I", "play_skip")
-	stopBtn := telegram.Button.Data("▢", "play_stop")
-	pauseBtn := telegram.Button.Data("II", "play_pause")
-	resumeBtn := telegram.Button.Data("▷", "play_resume")
-	muteBtn := telegram.Button.Data("🔇", "play_mute")
-	unmuteBtn := telegram.Button.Data("🔊", "play_unmute")
-
-	var keyboard *telegram.KeyboardBuilder
-
-	switch mode {
-	case "play":
-		keyboard = telegram.NewKeyboard().AddRow(skipBtn, stopBtn, pauseBtn, resumeBtn).AddRow(CloseBtn)
-	case "pause":
-		keyboard = telegram.NewKeyboard().AddRow(skipBtn, stopBtn, resumeBtn).AddRow(CloseBtn)
-	case "resume":
-		keyboard = telegram.NewKeyboard().AddRow(skipBtn, stopBtn, pauseBtn).AddRow(CloseBtn)
-	case "mute":
-		keyboard = telegram.NewKeyboard().AddRow(skipBtn, stopBtn, unmuteBtn).AddRow(CloseBtn)
-	case "unmute":
-		keyboard = telegram.NewKeyboard().AddRow(skipBtn, stopBtn, muteBtn).AddRow(CloseBtn)
-	default:
-		keyboard = telegram.NewKeyboard().AddRow(CloseBtn)
+	if keyboard, ok := controlKeyboards[mode]; ok {
+		return keyboard
 	}
-
-	return keyboard.Build()
+	return closeKeyboard
 }
 
 func LanguageKeyboard() *telegram.ReplyInlineMarkup {
@@ -1,23 +1,55 @@
 package cache
 
 import (
+	"errors"
 	"fmt"
+	"strconv"
+	"sync"
 	"time"
 
 	"github.com/Laky-64/gologging"
 	"github.com/amarnathcjd/gogram/telegram"
 )
 
+// ChatAdmins holds the administrators of a chat, both in the order returned by Telegram and indexed by user ID.
+type ChatAdmins struct {
+	List []*telegram.Participant
+	ByID map[int64]*telegram.Participant
+}
+
+// newChatAdmins builds a ChatAdmins entry, indexing the given participants by their user ID.
+func newChatAdmins(admins []*telegram.Participant) *ChatAdmins {
+	byID := make(map[int64]*telegram.Participant, len(admins))
+	for _, admin := range admins {
+		if admin != nil && admin.User != nil {
+			byID[admin.User.ID] = admin
+		}
+	}
+	return &ChatAdmins{List: admins, ByID: byID}
+}
+
+// ErrNotAdmin is returned by GetUserAdmin when the user is not an administrator of the chat.
+var ErrNotAdmin = errors.New("is not an administrator")
+
+// adminKey returns the AdminCache key for a chat.
+func adminKey(chatID int64) string {
+	return "admins:" + strconv.FormatInt(chatID, 10)
+}
+
 // AdminCache is a cache for chat administrators.
-var AdminCache = NewCache[[]*telegram.Participant](time.Hour)
+var AdminCache = NewCache[*ChatAdmins](time.Hour)
+
+// adminErrCache remembers recent failures to load the admin list of a chat, so that chats where the bot
+// cannot read its administrators do not trigger an API request on every message.
+var adminErrCache = NewCache[error](time.Minute)
 
 // GetChatAdmins retrieves the list of admin IDs for a given chat from the cache.
 // It takes a chat ID and returns a slice of admin IDs, or an error if the admins are not found in the cache.
 func GetChatAdmins(chatID int64) ([]int64, error) {
-	cacheKey := fmt.Sprintf("admins:%d", chatID)
+	cacheKey := adminKey(chatID)
 	if admins, ok := AdminCache.Get(cacheKey); ok {
-		var adminIDs []int64
-		for _, admin := range admins {
+		adminIDs := make([]int64, 0, len(admins.List))
+		for _, admin := range admins.List {
 			adminIDs = append(adminIDs, admin.User.ID)
 		}
 		return adminIDs, nil
@@ -25,51 +57,120 @@ func GetChatAdmins(chatID int64) ([]int64, error) {
 	return nil, fmt.Errorf("could not find admins in cache for chat %d", chatID)
 }
 
-// GetAdmins fetches a list of administrators from the cache or, if not present, from the Telegram API.
-// It accepts a Telegram client, a chat ID, and a boolean to force a reload from the API, bypassing the cache.
-// It returns a slice of telegram.Participant objects and any error encountered.
-func GetAdmins(client *telegram.Client, chatID int64, forceReload bool) ([]*telegram.Participant, error) {
-	cacheKey := fmt.Sprintf("admins:%d", chatID)
+// GetCachedAdmin looks up a single administrator in the cached admin list of a chat without calling the Telegram API.
+// It returns the participant and true if the user is a cached admin, otherwise nil and false.
+func GetCachedAdmin(chatID, userID int64) (*telegram.Participant, bool) {
+	admins, ok := AdminCache.Get(adminKey(chatID))
+	if !ok {
+		return nil, false
+	}
+	admin, ok := admins.ByID[userID]
+	return admin, ok
+}
+
+// adminLoad tracks an in-flight admin list request so that concurrent callers for the same chat can share its result.
+type adminLoad struct {
+	done   chan struct{}
+	admins *ChatAdmins
+	err    error
+}
+
+var (
+	adminLoadsMu sync.Mutex
+	adminLoads   = make(map[int64]*adminLoad)
+)
+
+// getChatAdmins returns the cached admin entry for a chat, loading it from the Telegram API when missing or when forceReload is set.
+// Concurrent loads for the same chat are coalesced into a single API request.
+func getChatAdmins(client *telegram.Client, chatID int64, forceReload bool) (*ChatAdmins, error) {
+	cacheKey := adminKey(chatID)
 	if !forceReload {
+		if err, ok := adminErrCache.Get(cacheKey); ok {
+			return nil, err
+		}
 		if admins, ok := AdminCache.Get(cacheKey); ok {
 			return admins, nil
 		}
 	}
 
+	adminLoadsMu.Lock()
+	if load, ok := adminLoads[chatID]; ok {
+		adminLoadsMu.Unlock()
+		<-load.done
+		return load.admins, load.err
+	}
+	load := &adminLoad{done: make(chan struct{})}
+	adminLoads[chatID] = load
+	adminLoadsMu.Unlock()
+
+	load.admins, load.err = fetchChatAdmins(client, chatID, cacheKey)
+
+	adminLoadsMu.Lock()
+	delete(adminLoads, chatID)
+	adminLoadsMu.Unlock()
+	close(load.done)
+
+	return load.admins, load.err
+}
+
+// adminsFilter selects administrators in GetChatMembers requests. It carries no state, so one value is shared by all loads.
+var adminsFilter = &telegram.ChannelParticipantsAdmins{}
+
+// fetchChatAdmins requests the admin list of a chat from the Telegram API and stores it in the cache.
+func fetchChatAdmins(client *telegram.Client, chatID int64, cacheKey string) (*ChatAdmins, error) {
 	opts := &telegram.ParticipantOptions{
-		Filter:           &telegram.ChannelParticipantsAdmins{},
+		Filter:           adminsFilter,
 		SleepThresholdMs: 3000,
 	}
 
-	admins, _, err := client.GetChatMembers(chatID, opts)
+	list, _, err := client.GetChatMembers(chatID, opts)
 	if err != nil {
+		adminErrCache.Set(cacheKey, err)
 		return nil, err
 	}
 
+	admins := newChatAdmins(list)
+	adminErrCache.Delete(cacheKey)
 	AdminCache.Set(cacheKey, admins)
 	return admins, nil
 }
 
+// GetAdmins fetches a list of administrators from the cache or, if not present, from the Telegram API.
+// It accepts a Telegram client, a chat ID, and a boolean to force a reload from the API, bypassing the cache.
+// It returns a slice of telegram.Participant objects and any error encountered.
+func GetAdmins(client *telegram.Client, chatID int64, forceReload bool) ([]*telegram.Participant, error) {
+	admins, err := getChatAdmins(client, chatID, forceReload)
+	if err != nil {
+		return nil, err
+	}
+	return admins.List, nil
+}
+
+// LookupAdmin resolves a user against the admin list of a chat with a single cache access, loading the list if needed.
+// It returns the participant, or nil if the user is not an administrator, and any error encountered while loading the list.
+func LookupAdmin(client *telegram.Client, chatID, userID int64) (*telegram.Participant, error) {
+	admins, err := getChatAdmins(client, chatID, false)
+	if err != nil {
+		return nil, err
+	}
+	return admins.ByID[userID], nil
+}
+
 // GetUserAdmin retrieves the participant information for a single administrator in a chat.
 // It accepts a Telegram client, a chat ID, a user ID, and a boolean to force a reload from the API.
 // It returns a telegram.Participant object or an error if the user is not an admin.
 func GetUserAdmin(client *telegram.Client, chatID int64, userID int64, forceReload bool) (*telegram.Participant, error) {
-	admins, err := GetAdmins(client, chatID, forceReload)
+	admins, err := getChatAdmins(client, chatID, forceReload)
 	if err != nil {
 		gologging.WarnF("GetUserAdmin error: %v", err)
-		// Cache a negative result for a short period to avoid repeated failed lookups.
-		cacheKey := fmt.Sprintf("admins:%d", chatID)
-		AdminCache.SetWithTTL(cacheKey, []*telegram.Participant{}, 10*time.Minute)
 		return nil, err
 	}
 
-	for _, admin := range admins {
-		if admin.User.ID == userID {
-			return admin, nil
-		}
+	if admin, ok := admins.ByID[userID]; ok {
+		return admin, nil
 	}
 
-	return nil, fmt.Errorf("user %d is not an administrator in chat %d", userID, chatID)
+	return nil, fmt.Errorf("user %d %w in chat %d", userID, ErrNotAdmin, chatID)
 }
 
 // ClearAdminCache removes cached administrator lists.
@@ -77,9 +178,11 @@ func GetUserAdmin(client *telegram.Client, chatID int64, userID int64, forceRelo
 func ClearAdminCache(chatID int64) {
 	if chatID == 0 {
 		AdminCache.Clear()
+		adminErrCache.Clear()
 		return
 	}
 
-	cacheKey := fmt.Sprintf("admins:%d", chatID)
+	cacheKey := adminKey(chatID)
 	AdminCache.Delete(cacheKey)
+	adminErrCache.Delete(cacheKey)
 }
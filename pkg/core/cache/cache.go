@@ -5,6 +5,9 @@ import (
 	"time"
 )
 
+// minPurgeSize is the number of entries a cache may hold before expired items are swept on insert.
+const minPurgeSize = 1024
+
 // CacheItem represents an item stored in the cache, containing a value and its expiration time.
 type CacheItem[T any] struct {
 	Value      T
@@ -12,18 +15,21 @@ type CacheItem[T any] struct {
 }
 
 // Cache is a generic, thread-safe TTL cache that stores values with string keys.
+// Expired items are removed lazily when they are read, and swept in bulk whenever the cache doubles in size.
 type Cache[T any] struct {
-	data map[string]CacheItem[T]
-	mu   sync.RWMutex
-	ttl  time.Duration
+	data      map[string]CacheItem[T]
+	mu        sync.RWMutex
+	ttl       time.Duration
+	nextPurge int
 }
 
 // NewCache initializes and returns a new Cache with a specified default TTL.
 // The ttl parameter sets the default time-to-live duration for cache items.
 func NewCache[T any](ttl time.Duration) *Cache[T] {
 	return &Cache[T]{
-		data: make(map[string]CacheItem[T]),
-		ttl:  ttl,
+		data:      make(map[string]CacheItem[T]),
+		ttl:       ttl,
+		nextPurge: minPurgeSize,
 	}
 }
 
@@ -34,8 +40,17 @@ func (c *Cache[T]) Get(key string) (T, bool) {
 	item, ok := c.data[key]
 	c.mu.RUnlock()
 
-	if !ok || time.Now().After(item.Expiration) {
-		var zero T
+	var zero T
+	if !ok {
+		return zero, false
+	}
+
+	if now := time.Now(); now.After(item.Expiration) {
+		c.mu.Lock()
+		if cur, ok := c.data[key]; ok && now.After(cur.Expiration) {
+			delete(c.data, key)
+		}
+		c.mu.Unlock()
 		return zero, false
 	}
 	return item.Value, true
@@ -50,13 +65,30 @@ func (c *Cache[T]) Set(key string, value T) {
 // SetWithTTL adds or updates a value in the cache with a custom TTL, overriding the default.
 // It takes a key, a value, and a custom TTL duration.
 func (c *Cache[T]) SetWithTTL(key string, value T, ttl time.Duration) {
+	now := time.Now()
+
 	c.mu.Lock()
 	defer c.mu.Unlock()
 
 	c.data[key] = CacheItem[T]{
 		Value:      value,
-		Expiration: time.Now().Add(ttl),
+		Expiration: now.Add(ttl),
+	}
+
+	if len(c.data) >= c.nextPurge {
+		c.purgeExpired(now)
+	}
+}
+
+// purgeExpired removes every expired item and moves the next sweep threshold to twice the remaining size.
+// The caller must hold the write lock.
+func (c *Cache[T]) purgeExpired(now time.Time) {
+	for key, item := range c.data {
+		if now.After(item.Expiration) {
+			delete(c.data, key)
+		}
 	}
+	c.nextPurge = max(2*len(c.data), minPurgeSize)
 }
 
 // Delete removes an item from the cache by its key.
@@ -71,4 +103,5 @@ func (c *Cache[T]) Clear() {
 	c.mu.Lock()
 	defer c.mu.Unlock()
 	c.data = make(map[string]CacheItem[T])
+	c.nextPurge = minPurgeSize
 }
@@ -3,9 +3,13 @@ package cache
 import (
 	"os"
 	"path/filepath"
+	"slices"
 	"sync"
 )
 
+// photosDir is the directory where track thumbnails are stored, named after the track ID.
+var photosDir = filepath.Join("database", "photos")
+
 // ChatData holds the state of a chat's music queue, including whether it is active and the list of tracks.
 type ChatData struct {
 	IsActive bool
@@ -33,7 +37,7 @@ func (c *ChatCacher) AddSong(chatID int64, song *CachedTrack) *CachedTrack {
 
 	data, ok := c.chatCache[chatID]
 	if !ok {
-		data = &ChatData{IsActive: true, Queue: []*CachedTrack{}}
+		data = &ChatData{IsActive: true}
 		c.chatCache[chatID] = data
 	}
 
@@ -72,19 +76,20 @@ func (c *ChatCacher) GetPlayingTrack(chatID int64) *CachedTrack {
 // It returns the removed track or nil if the queue was empty.
 func (c *ChatCacher) RemoveCurrentSong(chatID int64, diskClear bool) *CachedTrack {
 	c.mu.Lock()
-	defer c.mu.Unlock()
-
 	data, ok := c.chatCache[chatID]
 	if !ok || len(data.Queue) == 0 {
+		c.mu.Unlock()
 		return nil
 	}
 
 	removed := data.Queue[0]
+	// Clear the slot before reslicing: the backing array outlives the reslice and would otherwise keep the finished track alive.
+	data.Queue[0] = nil
 	data.Queue = data.Queue[1:]
+	c.mu.Unlock()
 
 	if diskClear && removed.FilePath != "" {
-		_ = os.Remove(removed.FilePath)
-		_ = os.Remove(filepath.Join("database", "photos", removed.TrackID+".png"))
+		removeFiles([]string{removed.FilePath, filepath.Join(photosDir, removed.TrackID+".png")})
 	}
 
 	return removed
@@ -107,7 +112,7 @@ func (c *ChatCacher) SetActive(chatID int64, active bool) {
 
 	data, ok := c.chatCache[chatID]
 	if !ok {
-		data = &ChatData{Queue: []*CachedTrack{}}
+		data = &ChatData{}
 		c.chatCache[chatID] = data
 	}
 	data.IsActive = active
@@ -116,21 +121,31 @@ func (c *ChatCacher) SetActive(chatID int64, active bool) {
 // ClearChat removes all tracks from a chat's queue and optionally deletes the files from disk.
 func (c *ChatCacher) ClearChat(chatID int64, diskClear bool) {
 	c.mu.Lock()
-	defer c.mu.Unlock()
-
 	data, ok := c.chatCache[chatID]
 	if !ok {
+		c.mu.Unlock()
 		return
 	}
+	delete(c.chatCache, chatID)
+	c.mu.Unlock()
 
 	if diskClear {
+		paths := make([]string, 0, len(data.Queue))
 		for _, track := range data.Queue {
 			if track.FilePath != "" {
-				_ = os.Remove(track.FilePath)
+				paths = append(paths, track.FilePath)
 			}
 		}
+		removeFiles(paths)
+	}
+}
+
+// removeFiles deletes the given files, ignoring errors for files that are already gone.
+// Callers run it after releasing the cache lock, so slow file system calls do not block other chats' queue operations.
+func removeFiles(paths []string) {
+	for _, path := range paths {
+		_ = os.Remove(path)
 	}
-	delete(c.chatCache, chatID)
 }
 
 // GetQueueLength returns the total number of songs in a chat's queue.
@@ -182,18 +197,19 @@ func (c *ChatCacher) RemoveTrack(chatID int64, index int) bool {
 		return false
 	}
 
-	data.Queue = append(data.Queue[:index], data.Queue[index+1:]...)
+	// slices.Delete shifts the tail in place and zeroes the vacated slot, so the removed track is not kept alive by the backing array.
+	data.Queue = slices.Delete(data.Queue, index, index+1)
 	return true
 }
 
-// GetQueue returns a copy of the current song queue for a chat.
+// GetQueue returns a copy of the current song queue for a chat, or nil if the chat has no queued songs.
 func (c *ChatCacher) GetQueue(chatID int64) []*CachedTrack {
 	c.mu.RLock()
 	defer c.mu.RUnlock()
 
 	data, ok := c.chatCache[chatID]
-	if !ok {
-		return []*CachedTrack{}
+	if !ok || len(data.Queue) == 0 {
+		return nil
 	}
 	return append([]*CachedTrack(nil), data.Queue...)
 }
@@ -203,7 +219,8 @@ func (c *ChatCacher) GetActiveChats() []int64 {
 	c.mu.RLock()
 	defer c.mu.RUnlock()
 
-	var active []int64
+	// Every cached chat is a candidate, so sizing for all of them replaces the repeated growth of append with one allocation.
+	active := make([]int64, 0, len(c.chatCache))
 	for chatID, data := range c.chatCache {
 		if data.IsActive {
 			active = append(active, chatID)
@@ -6,6 +6,7 @@ import (
 	"github.com/zuchzub/Go/pkg/config"
 "github.com/zuchzub/Go/pkg/core/cache"
 	"log"
+	"sync"
 	"time"
 
 	"go.mongodb.org/mongo-driver/bson"
@@ -13,6 +14,10 @@ import (
 	"go.mongodb.org/mongo-driver/mongo/options"
 )
 
+// authCacheTTL is kept short so a chat's authorized-user set is re-read from its document soon after any change
+// made outside AddAuthUser and RemoveAuthUser.
+const authCacheTTL = 30 * time.Second
+
 // Database encapsulates the MongoDB connection, database, collections, and caches.
 type Database struct {
 	Client    *mongo.Client
@@ -23,6 +28,22 @@ type Database struct {
 	ChatCache *cache.Cache[map[string]interface{}]
 	BotCache  *cache.Cache[map[string]interface{}]
 	UserCache *cache.Cache[map[string]interface{}]
+	AuthCache *cache.Cache[map[int64]struct{}]
+
+	// missingChats remembers chats that have no document, so repeated lookups for them do not each query the database.
+	missingChats *cache.Cache[struct{}]
+
+	chatLoadsMu sync.Mutex
+	chatLoads   map[int64]*chatLoad
+	// chatGens counts writes per chat, so a query that raced a write does not cache what it read. Guarded by chatLoadsMu.
+	chatGens map[int64]uint64
+}
+
+// chatLoad tracks an in-flight chat document query so that concurrent GetChat calls for the same chat can share its result.
+type chatLoad struct {
+	done chan struct{}
+	chat map[string]interface{}
+	err  error
 }
 
 // Instance is the global singleton for the database.
@@ -31,7 +52,16 @@ var Instance *Database
 // InitDatabase initializes the database connection and sets up the global instance.
 // It returns an error if the connection fails or pinging the database is unsuccessful.
 func InitDatabase(ctx context.Context) error {
-	client, err := mongo.Connect(ctx, options.Client().ApplyURI(config.Conf.MongoUri))
+	// Settings given in the URI take precedence over these defaults.
+	clientOpts := options.Client().
+		SetMaxPoolSize(100).
+		SetMinPoolSize(10).
+		SetMaxConnIdleTime(time.Minute).
+		SetServerSelectionTimeout(5 * time.Second).
+		SetCompressors([]string{"zstd", "snappy"}).
+		ApplyURI(config.Conf.MongoUri)
+
+	client, err := mongo.Connect(ctx, clientOpts)
 	if err != nil {
 		return err
 	}
@@ -47,6 +77,11 @@ func InitDatabase(ctx context.Context) error {
 		ChatCache: cache.NewCache[map[string]interface{}](20 * time.Minute),
 		BotCache:  cache.NewCache[map[string]interface{}](20 * time.Minute),
 		UserCache: cache.NewCache[map[string]interface{}](20 * time.Minute),
+		AuthCache: cache.NewCache[map[int64]struct{}](authCacheTTL),
+		chatLoads: make(map[int64]*chatLoad),
+		chatGens:  make(map[int64]uint64),
+
+		missingChats: cache.NewCache[struct{}](time.Minute),
 	}
 
 	if err := Instance.Ping(ctx); err != nil {
@@ -66,51 +101,126 @@ func (db *Database) Ping(ctx context.Context) error {
 // ----------------- CHAT -----------------
 
 // GetChat retrieves a chat's data from the cache or database.
+// Concurrent cache misses for the same chat are coalesced into a single database query.
 // It returns a map representing the chat data, or nil if not found.
 func (db *Database) GetChat(ctx context.Context, chatID int64) (map[string]interface{}, error) {
 	key := toKey(chatID)
 	if cached, ok := db.ChatCache.Get(key); ok {
 		return cached, nil
 	}
+	if _, ok := db.missingChats.Get(key); ok {
+		return nil, nil
+	}
+
+	db.chatLoadsMu.Lock()
+	if load, ok := db.chatLoads[chatID]; ok {
+		db.chatLoadsMu.Unlock()
+		select {
+		case <-load.done:
+			return load.chat, load.err
+		case <-ctx.Done():
+			return nil, ctx.Err()
+		}
+	}
+	load := &chatLoad{done: make(chan struct{})}
+	db.chatLoads[chatID] = load
+	db.chatLoadsMu.Unlock()
+
+	load.chat, load.err = db.fetchChat(ctx, chatID, key)
+
+	db.chatLoadsMu.Lock()
+	delete(db.chatLoads, chatID)
+	db.chatLoadsMu.Unlock()
+	close(load.done)
+
+	return load.chat, load.err
+}
+
+// fetchChat queries a chat's document from the database and stores it in the cache.
+// Nothing is cached if the chat was written while the query ran, since the result may already be stale.
+func (db *Database) fetchChat(ctx context.Context, chatID int64, key string) (map[string]interface{}, error) {
+	db.chatLoadsMu.Lock()
+	gen := db.chatGens[chatID]
+	db.chatLoadsMu.Unlock()
 
 	var chat map[string]interface{}
 	err := db.ChatDB.FindOne(ctx, bson.M{"_id": chatID}).Decode(&chat)
-	if errors.Is(err, mongo.ErrNoDocuments) {
-		return nil, nil
-	} else if err != nil {
+	missing := errors.Is(err, mongo.ErrNoDocuments)
+	if err != nil && !missing {
 		log.Printf("[DB] An error occurred while getting the chat: %v", err)
 		return nil, err
 	}
 
+	db.chatLoadsMu.Lock()
+	defer db.chatLoadsMu.Unlock()
+	if db.chatGens[chatID] != gen {
+		return chat, nil
+	}
+	if missing {
+		db.missingChats.Set(key, struct{}{})
+		return nil, nil
+	}
 	db.ChatCache.Set(key, chat)
 	return chat, nil
 }
 
+// chatWritten records a write to a chat's document, dropping any negative cache entry for it
+// and keeping in-flight GetChat queries from caching what they read before the write.
+func (db *Database) chatWritten(chatID int64, key string) {
+	db.chatLoadsMu.Lock()
+	db.chatGens[chatID]++
+	db.missingChats.Delete(key)
+	db.chatLoadsMu.Unlock()
+}
+
 // AddChat adds a new chat to the database if it does not already exist.
+// A cached chat is known to exist. Otherwise a single upsert both creates the document if needed and returns it for caching,
+// instead of querying first and writing second.
 func (db *Database) AddChat(ctx context.Context, chatID int64) error {
-	chat, _ := db.GetChat(ctx, chatID)
-	if chat != nil {
+	key := toKey(chatID)
+	if _, ok := db.ChatCache.Get(key); ok {
 		return nil // Chat already exists.
 	}
-	_, err := db.ChatDB.UpdateOne(ctx, bson.M{"_id": chatID}, bson.M{"$setOnInsert": bson.M{}}, options.Update().SetUpsert(true))
-	if err == nil {
+
+	opts := options.FindOneAndUpdate().SetUpsert(true).SetReturnDocument(options.Before)
+	var chat map[string]interface{}
+	err := db.ChatDB.FindOneAndUpdate(ctx, bson.M{"_id": chatID}, bson.M{"$setOnInsert": bson.M{}}, opts).Decode(&chat)
+	db.chatWritten(chatID, key)
+	switch {
+	case errors.Is(err, mongo.ErrNoDocuments):
+		// There was no document before the upsert, so the new one is empty.
+		db.ChatCache.Set(key, map[string]interface{}{"_id": chatID})
 		log.Printf("[DB] A new chat has been added: %d", chatID)
+	case err != nil:
+		return err
+	default:
+		db.ChatCache.Set(key, chat)
 	}
-	return err
+	return nil
 }
 
 // updateChatField updates a specific field in a chat's document.
 func (db *Database) updateChatField(ctx context.Context, chatID int64, key string, value interface{}) error {
-	_, err := db.ChatDB.UpdateOne(ctx, bson.M{"_id": chatID}, bson.M{"$set": bson.M{key: value}}, options.Update().SetUpsert(true))
+	return db.SetChatFields(ctx, chatID, bson.M{key: value})
+}
+
+// SetChatFields updates several fields of a chat's document with a single $set, creating the document if needed.
+// Callers changing more than one setting at once should use it instead of the individual setters to save round-trips.
+func (db *Database) SetChatFields(ctx context.Context, chatID int64, fields bson.M) error {
+	_, err := db.ChatDB.UpdateOne(ctx, bson.M{"_id": chatID}, bson.M{"$set": fields}, options.Update().SetUpsert(true))
 	if err != nil {
 		return err
 	}
-	cached, _ := db.ChatCache.Get(toKey(chatID))
+	key := toKey(chatID)
+	db.chatWritten(chatID, key)
+	cached, _ := db.ChatCache.Get(key)
 	if cached == nil {
-		cached = make(map[string]interface{})
+		cached = make(map[string]interface{}, len(fields))
 	}
-	cached[key] = value
-	db.ChatCache.Set(toKey(chatID), cached)
+	for k, v := range fields {
+		cached[k] = v
+	}
+	db.ChatCache.Set(key, cached)
 	return nil
 }
 
@@ -201,8 +311,18 @@ func (db *Database) SetAssistant(ctx context.Context, chatID int64, assistant st
 }
 
 // RemoveAssistant removes the assistant from a chat's settings.
+// The field is unset rather than set to null, and dropped from the cached document in the same step.
 func (db *Database) RemoveAssistant(ctx context.Context, chatID int64) error {
-	return db.updateChatField(ctx, chatID, "assistant", nil)
+	_, err := db.ChatDB.UpdateOne(ctx, bson.M{"_id": chatID}, bson.M{"$unset": bson.M{"assistant": ""}})
+	if err != nil {
+		return err
+	}
+	key := toKey(chatID)
+	db.chatWritten(chatID, key)
+	if cached, ok := db.ChatCache.Get(key); ok {
+		delete(cached, "assistant")
+	}
+	return nil
 }
 
 // SetUserLang sets the language for a given user.
@@ -260,38 +380,32 @@ func (db *Database) GetLang(ctx context.Context, chatID int64) string {
 
 // AddAuthUser adds a user to the list of authorized users for a chat.
 func (db *Database) AddAuthUser(ctx context.Context, chatID, userID int64) error {
-	_, err := db.ChatDB.UpdateOne(ctx,
-		bson.M{"_id": chatID},
-		bson.M{"$addToSet": bson.M{"auth_users": userID}},
-		options.Update().SetUpsert(true),
-	)
-	if err != nil {
-		return err
-	}
-	chat, _ := db.GetChat(ctx, chatID)
-	authUsers, _ := getIntSlice(chat["auth_users"])
-	if !contains(authUsers, userID) {
-		authUsers = append(authUsers, userID)
-	}
-	chat["auth_users"] = authUsers
-	db.ChatCache.Set(toKey(chatID), chat)
-	return nil
+	return db.updateAuthUsers(ctx, chatID, bson.M{"$addToSet": bson.M{"auth_users": userID}}, true)
 }
 
 // RemoveAuthUser removes a user from the list of authorized users for a chat.
 func (db *Database) RemoveAuthUser(ctx context.Context, chatID, userID int64) error {
-	_, err := db.ChatDB.UpdateOne(ctx,
-		bson.M{"_id": chatID},
-		bson.M{"$pull": bson.M{"auth_users": userID}},
-	)
-	if err != nil {
+	return db.updateAuthUsers(ctx, chatID, bson.M{"$pull": bson.M{"auth_users": userID}}, false)
+}
+
+// updateAuthUsers applies an update to a chat's auth_users list and caches the updated document.
+// The write and the read of the resulting document share a single FindOneAndUpdate round-trip.
+func (db *Database) updateAuthUsers(ctx context.Context, chatID int64, update bson.M, upsert bool) error {
+	key := toKey(chatID)
+	opts := options.FindOneAndUpdate().SetUpsert(upsert).SetReturnDocument(options.After)
+
+	var chat map[string]interface{}
+	err := db.ChatDB.FindOneAndUpdate(ctx, bson.M{"_id": chatID}, update, opts).Decode(&chat)
+	switch {
+	case errors.Is(err, mongo.ErrNoDocuments):
+		db.ChatCache.Delete(key)
+	case err != nil:
 		return err
+	default:
+		db.chatWritten(chatID, key)
+		db.ChatCache.Set(key, chat)
 	}
-	chat, _ := db.GetChat(ctx, chatID)
-	authUsers, _ := getIntSlice(chat["auth_users"])
-	authUsers = remove(authUsers, userID)
-	chat["auth_users"] = authUsers
-	db.ChatCache.Set(toKey(chatID), chat)
+	db.AuthCache.Delete(key)
 	return nil
 }
 
@@ -302,28 +416,41 @@ func (db *Database) GetAuthUsers(ctx context.Context, chatID int64) []int64 {
 	return users
 }
 
-// IsAuthUser checks if a specific user is in the list of authorized users for a chat.
-func (db *Database) IsAuthUser(ctx context.Context, chatID, userID int64) bool {
-	admins, err := cache.GetChatAdmins(chatID)
-	if err != nil || admins == nil {
-		admins = []int64{}
+// InAuthList checks if a user is in the stored list of authorized users for a chat, ignoring admin status.
+// The list is kept as a set in AuthCache so repeated checks do not convert and scan the chat document.
+// A failed chat load is reported as not authorized but is not cached, so the next check queries again.
+func (db *Database) InAuthList(ctx context.Context, chatID, userID int64) bool {
+	key := toKey(chatID)
+	set, ok := db.AuthCache.Get(key)
+	if !ok {
+		chat, err := db.GetChat(ctx, chatID)
+		if err != nil {
+			return false // Not cached, so the next check queries again.
+		}
+		users, _ := getIntSlice(chat["auth_users"])
+		set = make(map[int64]struct{}, len(users))
+		for _, id := range users {
+			set[id] = struct{}{}
+		}
+		db.AuthCache.Set(key, set)
 	}
 
-	if contains(admins, userID) {
+	_, ok = set[userID]
+	return ok
+}
+
+// IsAuthUser checks if a specific user is in the list of authorized users for a chat.
+func (db *Database) IsAuthUser(ctx context.Context, chatID, userID int64) bool {
+	if _, ok := cache.GetCachedAdmin(chatID, userID); ok {
 		return true
 	}
-
-	users := db.GetAuthUsers(ctx, chatID)
-	return contains(users, userID)
+	return db.InAuthList(ctx, chatID, userID)
 }
 
 // IsAdmin checks if a specific user is an administrator in a chat.
 func (db *Database) IsAdmin(ctx context.Context, chatID, userID int64) bool {
-	admins, err := cache.GetChatAdmins(chatID)
-	if err != nil || admins == nil {
-		admins = []int64{}
-	}
-	return contains(admins, userID)
+	_, ok := cache.GetCachedAdmin(chatID, userID)
+	return ok
 }
 
 // ----------------- BOT -----------------
@@ -339,7 +466,12 @@ func (db *Database) GetLoggerStatus(ctx context.Context, botID int64) bool {
 	}
 
 	var data map[string]interface{}
-	_ = db.BotDB.FindOne(ctx, bson.M{"_id": botID}).Decode(&data)
+	err := db.BotDB.FindOne(ctx, bson.M{"_id": botID}).Decode(&data)
+	if err != nil && !errors.Is(err, mongo.ErrNoDocuments) {
+		// Do not cache a failed read as "disabled"; the next call retries.
+		log.Printf("[DB] An error occurred while getting the logger status: %v", err)
+		return false
+	}
 
 	status := false
 	if val, ok := data["logger"].(bool); ok {
@@ -420,9 +552,9 @@ func (db *Database) IsUserExist(ctx context.Context, userID int64) (bool, error)
 		return true, nil
 	}
 
-	// If not in cache, check the database.
+	// If not in cache, check the database. Only the _id is needed, which the index covers.
 	var result bson.M
-	err := db.UserDB.FindOne(ctx, bson.M{"_id": userID}).Decode(&result)
+	err := db.UserDB.FindOne(ctx, bson.M{"_id": userID}, options.FindOne().SetProjection(idOnly)).Decode(&result)
 	if errors.Is(err, mongo.ErrNoDocuments) {
 		return false, nil
 	} else if err != nil {
@@ -434,9 +566,17 @@ func (db *Database) IsUserExist(ctx context.Context, userID int64) (bool, error)
 	return true, nil
 }
 
+// idOnly projects documents down to their _id, so queries that only need IDs are answered from the index.
+var idOnly = bson.M{"_id": 1}
+
+// listIDsOptions returns the options for listing every ID in a collection: an _id-only projection fetched in large batches.
+func listIDsOptions() *options.FindOptions {
+	return options.Find().SetProjection(idOnly).SetBatchSize(1000)
+}
+
 // GetAllChats retrieves a list of all chat IDs from the database.
 func (db *Database) GetAllChats(ctx context.Context) ([]int64, error) {
-	cursor, err := db.ChatDB.Find(ctx, bson.M{})
+	cursor, err := db.ChatDB.Find(ctx, bson.M{}, listIDsOptions())
 	if err != nil {
 		return nil, err
 	}
@@ -451,9 +591,6 @@ func (db *Database) GetAllChats(ctx context.Context) ([]int64, error) {
 			return nil, err
 		}
 		chats = append(chats, doc.ID)
-
-		// Cache each chat to optimize future lookups.
-		db.ChatCache.Set(toKey(doc.ID), map[string]interface{}{})
 	}
 	if err := cursor.Err(); err != nil {
 		return nil, err
@@ -463,7 +600,7 @@ func (db *Database) GetAllChats(ctx context.Context) ([]int64, error) {
 
 // GetAllUsers retrieves a list of all user IDs from the database.
 func (db *Database) GetAllUsers(ctx context.Context) ([]int64, error) {
-	cursor, err := db.UserDB.Find(ctx, bson.M{})
+	cursor, err := db.UserDB.Find(ctx, bson.M{}, listIDsOptions())
 	if err != nil {
 		return nil, err
 	}
@@ -479,8 +616,10 @@ func (db *Database) GetAllUsers(ctx context.Context) ([]int64, error) {
 		}
 		users = append(users, doc.ID)
 
-		// Cache each user to optimize future lookups.
-		db.UserCache.Set(toKey(doc.ID), map[string]interface{}{})
+		// Mark each user as known to optimize future lookups, without replacing a cached document that holds settings.
+		if _, ok := db.UserCache.Get(toKey(doc.ID)); !ok {
+			db.UserCache.Set(toKey(doc.ID), map[string]interface{}{})
+		}
 	}
 	if err := cursor.Err(); err != nil {
 		return nil, err
@@ -488,6 +627,18 @@ func (db *Database) GetAllUsers(ctx context.Context) ([]int64, error) {
 	return users, nil
 }
 
+// CountChats returns the number of chats stored in the database.
+// It uses the collection metadata instead of scanning documents, so the result is an estimate after an unclean shutdown.
+func (db *Database) CountChats(ctx context.Context) (int64, error) {
+	return db.ChatDB.EstimatedDocumentCount(ctx)
+}
+
+// CountUsers returns the number of users stored in the database.
+// It uses the collection metadata instead of scanning documents, so the result is an estimate after an unclean shutdown.
+func (db *Database) CountUsers(ctx context.Context) (int64, error) {
+	return db.UserDB.EstimatedDocumentCount(ctx)
+}
+
 // Close gracefully closes the database connection.
 func (db *Database) Close(ctx context.Context) error {
 	log.Println("[DB] Closing the database connection...")
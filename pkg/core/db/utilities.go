@@ -2,7 +2,7 @@ package db
 
 import (
 	"context"
-	"fmt"
+	"strconv"
 	"time"
 
 	"github.com/Laky-64/gologging"
@@ -11,7 +11,7 @@ import (
 
 // toKey converts an int64 ID into a string format suitable for use as a cache key.
 func toKey(id int64) string {
-	return fmt.Sprintf("%d", id)
+	return strconv.FormatInt(id, 10)
 }
 
 // getIntSlice safely converts an interface value into a slice of int64.
@@ -57,28 +57,6 @@ func convertInterfaceSlice(arr []interface{}) ([]int64, bool) {
 	return out, true
 }
 
-// contains checks if a given int64 slice contains a specific ID.
-// It returns true if the ID is found, and false otherwise.
-func contains(list []int64, id int64) bool {
-	for _, v := range list {
-		if v == id {
-			return true
-		}
-	}
-	return false
-}
-
-// remove creates a new slice that excludes a specific ID from the original int64 slice.
-func remove(list []int64, id int64) []int64 {
-	var newList []int64
-	for _, v := range list {
-		if v != id {
-			newList = append(newList, v)
-		}
-	}
-	return newList
-}
-
 // Ctx creates a new context with a default timeout of 5 seconds.
 // It returns the context and a cancel function to release resources.
 func Ctx() (context.Context, context.CancelFunc) {
@@ -15,12 +15,29 @@ import (
 	"github.com/Laky-64/gologging"
 )
 
+// apiURLPattern matches the URLs of every platform served by the API gateway: Apple Music, Spotify, SoundCloud, JioSaavn,
+// YouTube playlists and YouTube Music. The platform patterns are fused into one alternation compiled once at start-up,
+// so a query is checked in a single pass instead of once per platform.
+var apiURLPattern = regexp.MustCompile(`(?i)^(?:https?://)?(?:` +
+	`(?:[a-z0-9-]+\.)*(?:` +
+	`music\.apple\.com/(?:[a-z]{2}/)?(?:album|playlist|song)/[a-zA-Z0-9\-._]+/(?:pl\.[a-zA-Z0-9]+|\d+)` +
+	`|spotify\.com/(?:track|playlist|album|artist)/[a-zA-Z0-9]+` +
+	`|soundcloud\.com/[a-zA-Z0-9_-]+(?:/(?:sets)?/[a-zA-Z0-9_-]+)?` +
+	`)(?:\?.*)?$` +
+	`|(?:www\.)?jiosaavn\.com/(?:song|featured)/[\w-]+/[a-zA-Z0-9_-]+$` +
+	`|(?:www\.)?(?:youtube\.com|music\.youtube\.com)/(?:playlist|watch)\?.*\blist=[\w-]+` +
+	`|music\.youtube\.com/(?:watch|playlist)\?.*v=[\w-]+` +
+	`)`)
+
 // ApiData provides a unified interface for fetching track and playlist information from various music platforms via an API gateway.
 type ApiData struct {
-	Query    string
-	ApiUrl   string
-	APIKey   string
-	Patterns map[string]*regexp.Regexp
+	Query  string
+	ApiUrl string
+	APIKey string
+
+	// validated and valid memoize IsValid, which the wrapper, Search, and GetInfo may each call for the same query.
+	validated bool
+	valid     bool
 }
 
 // NewApiData creates and initializes a new ApiData instance with the provided query.
@@ -29,31 +46,31 @@ func NewApiData(query string) *ApiData {
 		Query:  strings.TrimSpace(query),
 		ApiUrl: strings.TrimRight(config.Conf.ApiUrl, "/"),
 		APIKey: config.Conf.ApiKey,
-		Patterns: map[string]*regexp.Regexp{
-			"apple_music": regexp.MustCompile(`(?i)^(https?://)?([a-z0-9-]+\.)*music\.apple\.com/([a-z]{2}/)?(album|playlist|song)/[a-zA-Z0-9\-._]+/(pl\.[a-zA-Z0-9]+|\d+)(\?.*)?$`),
-			"spotify":     regexp.MustCompile(`(?i)^(https?://)?([a-z0-9-]+\.)*spotify\.com/(track|playlist|album|artist)/[a-zA-Z0-9]+(\?.*)?$`),
-			"yt_playlist": regexp.MustCompile(`(?i)^(?:https?://)?(?:www\.)?(?:youtube\.com|music\.youtube\.com)/(?:playlist|watch)\?.*\blist=([\w-]+)`),
-			"yt_music":    regexp.MustCompile(`(?i)^(?:https?://)?music\.youtube\.com/(?:watch|playlist)\?.*v=([\w-]+)`),
-			"jiosaavn":    regexp.MustCompile(`(?i)^(https?://)?(www\.)?jiosaavn\.com/(song|featured)/[\w-]+/[a-zA-Z0-9_-]+$`),
-			"soundcloud":  regexp.MustCompile(`(?i)^(https?://)?([a-z0-9-]+\.)*soundcloud\.com/[a-zA-Z0-9_-]+(/(sets)?/[a-zA-Z0-9_-]+)?(\?.*)?$`),
-		},
 	}
 }
 
 // IsValid checks if the query is a valid URL for any of the supported platforms.
+// The result is computed once per ApiData, so the Query should not be changed after the first call.
 // It returns true if the URL matches a known pattern, and false otherwise.
 func (a *ApiData) IsValid() bool {
+	if !a.validated {
+		a.valid = a.isValid()
+		a.validated = true
+	}
+	return a.valid
+}
+
+// isValid performs the validation memoized by IsValid.
+func (a *ApiData) isValid() bool {
 	if a.Query == "" || a.ApiUrl == "" || a.APIKey == "" {
 		gologging.WarnF("The query, API URL, or API key is missing.")
 		return false
 	}
-	for name, pattern := range a.Patterns {
-		if pattern.MatchString(a.Query) {
-			gologging.DebugF("The platform has been matched: %s\n", name)
-			return true
-		}
+	// Every supported URL contains a host with a dot; plain search text usually has none and is rejected without running the regex.
+	if strings.IndexByte(a.Query, '.') < 0 {
+		return false
 	}
-	return false
+	return apiURLPattern.MatchString(a.Query)
 }
 
 // GetInfo retrieves metadata for a track or playlist from the API.
@@ -100,7 +117,7 @@ func (a *ApiData) Search(ctx context.Context) (cache.PlatformTracks, error) {
 	}
 	req.Header.Set("X-API-Key", a.APIKey)
 
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := client.Do(req)
 	if err != nil {
 		return cache.PlatformTracks{}, fmt.Errorf("the search request failed: %w", err)
 	}
@@ -142,7 +159,7 @@ func (a *ApiData) GetTrack(ctx context.Context) (cache.TrackInfo, error) {
 // it delegates the download to the YouTube downloader.
 // It returns the file path of the downloaded track or an error if the download fails.
 func (a *ApiData) downloadTrack(ctx context.Context, info cache.TrackInfo, video bool) (string, error) {
-	if info.Platform == "youtube" && video {
+	if info.Platform == cache.YouTube && video {
 		yt := NewYouTubeData(a.Query)
 		return yt.downloadTrack(ctx, info, video)
 	}
@@ -154,7 +171,7 @@ func (a *ApiData) downloadTrack(ctx context.Context, info cache.TrackInfo, video
 
 	filePath, err := downloader.Process()
 	if err != nil {
-		if info.Platform == "youtube" {
+		if info.Platform == cache.YouTube {
 			yt := NewYouTubeData(a.Query)
 			return yt.downloadTrack(ctx, info, video)
 		}
@@ -7,15 +7,19 @@ import (
 	"net/url"
 	"regexp"
 	"strings"
+	"time"
 )
 
 const (
-	downloadTimeout        = 300
+	downloadTimeout        = 300 * time.Second
 	defaultDownloadDirPerm = 0755
 )
 
 var (
-	tgURLRegex             = regexp.MustCompile(`^https?://t\.me/`)
+	tgURLRegex       = regexp.MustCompile(`^https?://t\.me/`)
+	contentDispRegex = regexp.MustCompile(`filename\*?=(?:UTF-8'')?([^;]+)`)
+	// unsafeFilenameChars strips path separators and other characters that are invalid in filenames.
+	unsafeFilenameChars    = strings.NewReplacer("<", "", ">", "", ":", "", `"`, "", "/", "", `\`, "", "|", "", "?", "", "*", "")
 	errMissingCDNURL       = errors.New("missing cdn url")
 	errUnsupportedPlatform = errors.New("unsupported platform")
 )
@@ -41,7 +45,7 @@ func (d *Download) Process() (string, error) {
 	switch {
 	case d.Track.CdnURL == "":
 		return "", errMissingCDNURL
-	case strings.EqualFold(d.Track.Platform, "spotify"):
+	case strings.EqualFold(d.Track.Platform, cache.Spotify):
 		return d.processSpotify()
 	default:
 		return d.processDirectDL()
@@ -66,14 +70,7 @@ func (d *Download) processDirectDL() (string, error) {
 
 // sanitizeFilename removes invalid characters from a filename to ensure it is safe for the filesystem.
 func sanitizeFilename(fileName string) string {
-	// Remove path separators.
-	fileName = strings.ReplaceAll(fileName, "/", "")
-	fileName = strings.ReplaceAll(fileName, "\\", "")
-	// Remove other invalid characters.
-	fileName = regexp.MustCompile(`[<>:"/\\|?*]`).ReplaceAllString(fileName, "")
-	// Trim leading and trailing whitespace.
-	fileName = strings.TrimSpace(fileName)
-	return fileName
+	return strings.TrimSpace(unsafeFilenameChars.Replace(fileName))
 }
 
 // extractFilename parses the Content-Disposition header to extract the original filename.
@@ -83,8 +80,7 @@ func extractFilename(contentDisp string) string {
 		return ""
 	}
 	// Match both "filename=" and "filename*=" to support a wider range of servers.
-	re := regexp.MustCompile(`filename\*?=(?:UTF-8'')?([^;]+)`)
-	matches := re.FindStringSubmatch(contentDisp)
+	matches := contentDispRegex.FindStringSubmatch(contentDisp)
 	if len(matches) > 1 {
 		// URL-decode the filename to handle encoded characters.
 		decoded, err := url.QueryUnescape(matches[1])
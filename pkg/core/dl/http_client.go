@@ -3,19 +3,23 @@ package dl
 import (
 	"context"
 	"crypto/rand"
+	"encoding/hex"
 	"errors"
 	"fmt"
 	"github.com/zuchzub/Go/pkg/config"
 	"io"
+	"io/fs"
 	"log"
-	"math/big"
+	mrand "math/rand"
 	"net"
 	"net/http"
 	"net/url"
 	"os"
 	"path"
 	"path/filepath"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/Laky-64/gologging"
@@ -26,18 +30,40 @@ const (
 	defaultConnectTimeout = 10 * time.Second
 	maxRetries            = 2
 	initialBackoff        = 1 * time.Second
+	maxRetryAfter         = 10 * time.Second
+	// Files of at least parallelMinSize are fetched as downloadParts concurrent byte ranges when the server supports it.
+	parallelMinSize = 8 << 20
+	downloadParts   = 4
+	// copyBufferSize is the chunk size used when writing downloads to disk; larger chunks mean fewer syscalls per file.
+	copyBufferSize = 1 << 20
 )
 
+// copyBufPool recycles the copy buffers so concurrent downloads do not each allocate a fresh one.
+var copyBufPool = sync.Pool{New: func() any {
+	b := make([]byte, copyBufferSize)
+	return &b
+}}
+
+// client is shared by all API requests so that connections to the API host are kept alive and reused across calls.
 var client = &http.Client{
 	Timeout: defaultRequestTimeout,
 	Transport: &http.Transport{
+		Proxy:                 http.ProxyFromEnvironment,
+		DialContext:           (&net.Dialer{Timeout: defaultConnectTimeout, KeepAlive: 30 * time.Second}).DialContext,
+		ForceAttemptHTTP2:     true,
 		TLSHandshakeTimeout:   defaultConnectTimeout,
 		ResponseHeaderTimeout: defaultRequestTimeout,
 		IdleConnTimeout:       90 * time.Second,
 		MaxIdleConns:          100,
+		// Nearly all requests go to the single API host, so allow it more idle connections than the default of two.
+		MaxIdleConnsPerHost: 50,
 	},
 }
 
+// downloadClient shares the transport, and therefore the connection pool and TLS sessions, of client.
+// It has no overall timeout because file transfers can take longer than API calls; callers bound them with a context instead.
+var downloadClient = &http.Client{Transport: client.Transport}
+
 // sendRequest performs an HTTP request with a given context, method, URL, body, and headers.
 // It includes retry logic with exponential backoff for temporary network errors and server-side issues.
 // It returns an HTTP response or an error if the request fails after all retries.
@@ -58,17 +84,29 @@ func sendRequest(ctx context.Context, method, fullURL string, body io.Reader, he
 	var resp *http.Response
 	var reqErr error
 	backoff := initialBackoff
+	var delay time.Duration
 
 	for attempt := 0; attempt < maxRetries; attempt++ {
 		if attempt > 0 {
-			time.Sleep(backoff)
+			timer := time.NewTimer(delay)
+			select {
+			case <-ctx.Done():
+				timer.Stop()
+				return nil, fmt.Errorf("request failed: %w", ctx.Err())
+			case <-timer.C:
+			}
 			backoff *= 2
 		}
+		// Jitter the wait so clients that failed together do not all retry at the same moment.
+		delay = time.Duration(float64(backoff) * (0.5 + mrand.Float64()))
 
 		resp, reqErr = client.Do(req)
 		if reqErr == nil {
-			if resp.StatusCode < 500 {
-				return resp, nil // Success
+			if !isRetryableStatus(resp.StatusCode) {
+				return resp, nil // Success, or an error that retrying cannot fix
+			}
+			if after, ok := parseRetryAfter(resp.Header.Get("Retry-After")); ok {
+				delay = after
 			}
 			if err := resp.Body.Close(); err != nil {
 				gologging.WarnF("failed to close response body: %v", err)
@@ -89,6 +127,25 @@ func sendRequest(ctx context.Context, method, fullURL string, body io.Reader, he
 	return nil, fmt.Errorf("request failed: %w", reqErr)
 }
 
+// isRetryableStatus reports whether a response status may succeed on retry: server errors,
+// timeouts and rate limiting. Other client errors are returned to the caller immediately.
+func isRetryableStatus(code int) bool {
+	switch code {
+	case http.StatusRequestTimeout, http.StatusTooEarly, http.StatusTooManyRequests:
+		return true
+	}
+	return code >= 500
+}
+
+// parseRetryAfter parses a Retry-After header given in seconds, capped at maxRetryAfter.
+func parseRetryAfter(v string) (time.Duration, bool) {
+	secs, err := strconv.Atoi(v)
+	if err != nil || secs < 0 {
+		return 0, false
+	}
+	return min(time.Duration(secs)*time.Second, maxRetryAfter), true
+}
+
 // isTemporaryError determines if an error is temporary and thus worth retrying.
 // It returns true for network timeouts and temporary operational errors.
 func isTemporaryError(err error) bool {
@@ -98,11 +155,12 @@ func isTemporaryError(err error) bool {
 	return false
 }
 
-// generateUniqueName creates a pseudo-random filename using a combination of the current timestamp and a random number.
+// generateUniqueName creates a random filename from 8 bytes of crypto/rand output encoded as hex.
 // It takes a file extension and returns a unique filename.
 func generateUniqueName(ext string) string {
-	n, _ := rand.Int(rand.Reader, big.NewInt(99999))
-	return fmt.Sprintf("%d_%05d%s", time.Now().UnixNano(), n.Int64(), ext)
+	var b [8]byte
+	_, _ = rand.Read(b[:])
+	return hex.EncodeToString(b[:]) + ext
 }
 
 // determineFilename safely determines a valid filename for a download.
@@ -123,23 +181,199 @@ func determineFilename(urlStr, contentDisp string) string {
 	return filepath.Join(config.Conf.DownloadsDir, generateUniqueName(".tmp"))
 }
 
-// writeToFile writes data from an io.Reader to a specified file.
-// It returns an error if file creation or writing fails.
-func writeToFile(filename string, data io.Reader) error {
-	// #nosec G304 - This is a security risk if the filename is not properly sanitized.
-	out, err := os.Create(filename)
+// copyToFile streams data into out in chunks of copyBufferSize bytes.
+func copyToFile(out *os.File, data io.Reader) error {
+	if _, err := fillCopy(out, data); err != nil {
+		return fmt.Errorf("failed to write to the file: %w", err)
+	}
+	return nil
+}
+
+// fillCopy copies src to dst like io.Copy, but fills a pooled copyBufferSize buffer before each write.
+// A network body returns whatever has arrived on each Read, often a few KiB on a slow link and more on a fast one,
+// so writing per Read would make the write size follow the bandwidth; filling first keeps every write full-sized.
+func fillCopy(dst io.Writer, src io.Reader) (int64, error) {
+	bufp := copyBufPool.Get().(*[]byte)
+	defer copyBufPool.Put(bufp)
+	buf := *bufp
+
+	var written int64
+	for {
+		n := 0
+		var rerr error
+		for n < len(buf) && rerr == nil {
+			var m int
+			m, rerr = src.Read(buf[n:])
+			n += m
+		}
+		if n > 0 {
+			m, werr := dst.Write(buf[:n])
+			written += int64(m)
+			if werr != nil {
+				return written, werr
+			}
+		}
+		if rerr == io.EOF {
+			return written, nil
+		}
+		if rerr != nil {
+			return written, rerr
+		}
+	}
+}
+
+// errRangeMismatch reports a range response that does not belong to the file being downloaded,
+// either because the file changed since the first response or because the server sent something else.
+var errRangeMismatch = errors.New("the range response does not match the requested file")
+
+// rangeValidator returns the validator to send in If-Range for follow-up range requests of resp:
+// its strong ETag, or else its Last-Modified date. Ranges must not be used when it returns "".
+func rangeValidator(resp *http.Response) string {
+	if etag := resp.Header.Get("ETag"); etag != "" && !strings.HasPrefix(etag, "W/") {
+		return etag
+	}
+	return resp.Header.Get("Last-Modified")
+}
+
+// openDownload requests urlStr for download and returns the response if its status is 200 OK.
+func openDownload(ctx context.Context, urlStr string) (*http.Response, error) {
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, urlStr, nil)
 	if err != nil {
-		return fmt.Errorf("failed to create the file: %w", err)
+		return nil, fmt.Errorf("failed to create the request: %w", err)
 	}
-	defer out.Close()
+	// Media is already compressed; ask for the raw bytes so the transport does not gzip-decode them.
+	req.Header.Set("Accept-Encoding", "identity")
 
-	if _, err := io.Copy(out, data); err != nil {
-		return fmt.Errorf("failed to write to the file: %w", err)
+	resp, err := downloadClient.Do(req)
+	if err != nil {
+		return nil, fmt.Errorf("the request failed: %w", err)
+	}
+	if resp.StatusCode != http.StatusOK {
+		resp.Body.Close()
+		return nil, fmt.Errorf("unexpected status code received: %d", resp.StatusCode)
+	}
+	return resp, nil
+}
+
+// downloadRanges writes resp's body to out as downloadParts byte ranges fetched concurrently,
+// which keeps several connections busy instead of waiting on one. The first range is read from resp itself.
+// It returns an error if any range fails, wrapping errRangeMismatch if a range came from a different file.
+func downloadRanges(ctx context.Context, urlStr string, out *os.File, resp *http.Response) error {
+	size := resp.ContentLength
+	validator := rangeValidator(resp)
+	if err := out.Truncate(size); err != nil {
+		return fmt.Errorf("failed to allocate the file: %w", err)
+	}
+
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	partSize := (size + downloadParts - 1) / downloadParts
+	errs := make([]error, downloadParts)
+	var wg sync.WaitGroup
+	for i := 1; i < downloadParts; i++ {
+		start := int64(i) * partSize
+		end := min(start+partSize, size) - 1
+		wg.Add(1)
+		go func(i int) {
+			defer wg.Done()
+			if errs[i] = fetchRange(ctx, urlStr, out, start, end, size, validator); errs[i] != nil {
+				cancel()
+			}
+		}(i)
+	}
+
+	if errs[0] = copyAt(out, resp.Body, 0, partSize); errs[0] != nil {
+		cancel()
 	}
+	wg.Wait()
 
+	if err := errors.Join(errs...); err != nil {
+		return fmt.Errorf("failed to write to the file: %w", err)
+	}
 	return nil
 }
 
+// fetchRange requests bytes start through end (inclusive) of urlStr and writes them at the same offset in out.
+// The request carries validator in If-Range, and the response must cover exactly that range of a file of the given size;
+// anything else, including a full 200 response, is reported as errRangeMismatch.
+func fetchRange(ctx context.Context, urlStr string, out *os.File, start, end, size int64, validator string) error {
+	req, err := http.NewRequestWithContext(ctx, http.MethodGet, urlStr, nil)
+	if err != nil {
+		return fmt.Errorf("failed to create the range request: %w", err)
+	}
+	req.Header.Set("Range", fmt.Sprintf("bytes=%d-%d", start, end))
+	req.Header.Set("If-Range", validator)
+	req.Header.Set("Accept-Encoding", "identity")
+
+	resp, err := downloadClient.Do(req)
+	if err != nil {
+		return fmt.Errorf("the range request failed: %w", err)
+	}
+	defer resp.Body.Close()
+
+	if resp.StatusCode == http.StatusOK {
+		return fmt.Errorf("%w: got the whole file for range %d-%d", errRangeMismatch, start, end)
+	}
+	if resp.StatusCode != http.StatusPartialContent {
+		return fmt.Errorf("unexpected status code for range %d-%d: %d", start, end, resp.StatusCode)
+	}
+	if got, want := resp.Header.Get("Content-Range"), fmt.Sprintf("bytes %d-%d/%d", start, end, size); got != want {
+		return fmt.Errorf("%w: got Content-Range %q, want %q", errRangeMismatch, got, want)
+	}
+	return copyAt(out, resp.Body, start, end-start+1)
+}
+
+// copyAt copies exactly n bytes from r into out starting at offset off.
+func copyAt(out *os.File, r io.Reader, off, n int64) error {
+	written, err := fillCopy(io.NewOffsetWriter(out, off), io.LimitReader(r, n))
+	if err == nil && written != n {
+		err = io.ErrUnexpectedEOF
+	}
+	return err
+}
+
+// resumableCopy streams resp's body into out. If the stream breaks and the server supports byte ranges,
+// it requests only the missing tail, up to maxRetries times, instead of failing the whole download.
+// A tail that does not match the original response fails the download rather than being appended.
+func resumableCopy(ctx context.Context, urlStr string, out *os.File, resp *http.Response) error {
+	err := copyToFile(out, resp.Body)
+	size := resp.ContentLength
+	validator := rangeValidator(resp)
+	if err == nil || size <= 0 || resp.Header.Get("Accept-Ranges") != "bytes" || validator == "" {
+		return err
+	}
+
+	for attempt := 0; attempt < maxRetries && ctx.Err() == nil; attempt++ {
+		// Writes are sequential from offset zero, so the file size is the number of bytes received.
+		info, statErr := out.Stat()
+		if statErr != nil || info.Size() >= size {
+			return err
+		}
+		gologging.InfoF("Resuming the download at byte %d of %d after: %v", info.Size(), size, err)
+		if err = fetchRange(ctx, urlStr, out, info.Size(), size-1, size, validator); err == nil || errors.Is(err, errRangeMismatch) {
+			return err
+		}
+	}
+	return err
+}
+
+// restartDownload discards what out holds and downloads urlStr into it again as a single stream.
+func restartDownload(ctx context.Context, urlStr string, out *os.File) error {
+	if err := out.Truncate(0); err != nil {
+		return fmt.Errorf("failed to reset the file: %w", err)
+	}
+	if _, err := out.Seek(0, io.SeekStart); err != nil {
+		return fmt.Errorf("failed to reset the file: %w", err)
+	}
+	resp, err := openDownload(ctx, urlStr)
+	if err != nil {
+		return err
+	}
+	defer resp.Body.Close()
+	return resumableCopy(ctx, urlStr, out, resp)
+}
+
 // DownloadFile downloads a file from a URL and saves it to a local path.
 // It supports overwriting existing files and determines the filename automatically if not provided.
 // It returns the final file path or an error if the download fails.
@@ -148,45 +382,73 @@ func DownloadFile(ctx context.Context, urlStr, fileName string, overwrite bool)
 		return "", errors.New("an empty URL was provided")
 	}
 
+	// With the name known up front, skip the request entirely when the file is already there.
+	if fileName != "" && !overwrite {
+		if _, err := os.Stat(fileName); err == nil {
+			return fileName, nil
+		}
+	}
+
 	ctx, cancel := context.WithTimeout(ctx, downloadTimeout)
 	defer cancel()
 
-	req, err := http.NewRequestWithContext(ctx, http.MethodGet, urlStr, nil)
-	if err != nil {
-		return "", fmt.Errorf("failed to create the request: %w", err)
-	}
-
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := openDownload(ctx, urlStr)
 	if err != nil {
-		return "", fmt.Errorf("the request failed: %w", err)
+		return "", err
 	}
 	defer resp.Body.Close()
 
-	if resp.StatusCode != http.StatusOK {
-		return "", fmt.Errorf("unexpected status code received: %d", resp.StatusCode)
-	}
-
 	if fileName == "" {
 		fileName = determineFilename(urlStr, resp.Header.Get("Content-Disposition"))
+		if !overwrite {
+			if _, err := os.Stat(fileName); err == nil {
+				return fileName, nil // File already exists, no need to download again.
+			}
+		}
 	}
 
-	if !overwrite {
-		if _, err := os.Stat(fileName); err == nil {
-			return fileName, nil // File already exists, no need to download again.
+	// Download to a uniquely named temporary .part file so the final name only ever holds a complete file,
+	// and concurrent downloads of the same file never write into each other's temp file.
+	dir, pattern := filepath.Split(fileName)
+	if dir == "" {
+		dir = "." // CreateTemp would otherwise fall back to the system temp directory.
+	}
+	pattern += ".*.part"
+	out, err := os.CreateTemp(dir, pattern)
+	if errors.Is(err, fs.ErrNotExist) {
+		// The directory usually exists already, so it is only created once a create in it has failed.
+		if err := os.MkdirAll(dir, defaultDownloadDirPerm); err != nil {
+			return "", fmt.Errorf("failed to create the directory: %w", err)
 		}
+		out, err = os.CreateTemp(dir, pattern)
 	}
-
-	if err := os.MkdirAll(filepath.Dir(fileName), defaultDownloadDirPerm); err != nil {
-		return "", fmt.Errorf("failed to create the directory: %w", err)
+	if err != nil {
+		return "", fmt.Errorf("failed to create the file: %w", err)
 	}
+	tempPath := out.Name()
 
-	// Download to a temporary .part file to ensure atomicity.
-	tempPath := fileName + ".part"
-	if err := writeToFile(tempPath, resp.Body); err != nil {
+	if resp.ContentLength >= parallelMinSize && resp.Header.Get("Accept-Ranges") == "bytes" && rangeValidator(resp) != "" {
+		err = downloadRanges(ctx, urlStr, out, resp)
+		if errors.Is(err, errRangeMismatch) {
+			gologging.InfoF("Downloading %s as a single stream after: %v", urlStr, err)
+			err = restartDownload(ctx, urlStr, out)
+		}
+	} else {
+		err = resumableCopy(ctx, urlStr, out, resp)
+	}
+	if err == nil {
+		// CreateTemp uses mode 0600; give the result the permissions os.Create would have.
+		err = out.Chmod(0644)
+	}
+	if closeErr := out.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		_ = os.Remove(tempPath)
 		return "", err
 	}
 
-	// Rename the temporary file to its final name upon successful download.
+	// Rename the temporary file to its final name upon successful download; os.Rename replaces any existing file atomically.
 	if err := os.Rename(tempPath, fileName); err != nil {
 		return "", fmt.Errorf("failed to rename the temporary file: %w", err)
 	}
@@ -31,26 +31,29 @@ type DownloaderWrapper struct {
 // NewDownloaderWrapper selects the appropriate MusicService based on the query format or configuration defaults.
 // It returns a new DownloaderWrapper configured with the chosen service.
 func NewDownloaderWrapper(query string) *DownloaderWrapper {
+	return &DownloaderWrapper{
+		Query:   query,
+		Service: chooseService(query),
+	}
+}
+
+// chooseService picks the MusicService for a query, constructing each candidate only when the previous one rejected it.
+// Already-constructed candidates are reused for the configured default, so no service is built twice.
+func chooseService(query string) MusicService {
 	yt := NewYouTubeData(query)
-	api := NewApiData(query)
-	var chosen MusicService
 	if yt.IsValid() {
-		chosen = yt
-	} else if api.IsValid() {
-		chosen = api
-	} else {
-		switch config.Conf.DefaultService {
-		case "spotify":
-			chosen = api
-		default:
-			chosen = yt
-		}
+		return yt
 	}
 
-	return &DownloaderWrapper{
-		Query:   query,
-		Service: chosen,
+	api := NewApiData(query)
+	if api.IsValid() {
+		return api
+	}
+
+	if config.Conf.DefaultService == "spotify" {
+		return api
 	}
+	return yt
 }
 
 // IsValid checks if the underlying service can handle the query.
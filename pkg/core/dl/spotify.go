@@ -1,40 +1,50 @@
 package dl
 
 import (
+	"bytes"
+	"context"
 	"crypto/aes"
 	"crypto/cipher"
 	"encoding/hex"
 	"errors"
 	"fmt"
 	"github.com/zuchzub/Go/pkg/config"
-	"github.com/zuchzub/Go/pkg/core/cache"
 	"io"
 	"log"
 	"net/http"
 	"os"
 	"os/exec"
 	"path/filepath"
+	"sync"
 	"time"
 )
 
-const (
-	defaultFilePerm = 0644
-)
-
 var (
 	errMissingKey    = errors.New("missing CDN key")
-	errFileNotFound  = errors.New("file not found")
 	errInvalidHexKey = errors.New("invalid hex key")
-	errInvalidAESIV  = errors.New("invalid AES IV")
+
+	// audioAesIV is the fixed initial counter block for Spotify audio files (72e067fbddcbcf77ebe8bc643f630d93).
+	audioAesIV = []byte{0x72, 0xe0, 0x67, 0xfb, 0xdd, 0xcb, 0xcf, 0x77, 0xeb, 0xe8, 0xbc, 0x64, 0x3f, 0x63, 0x0d, 0x93}
+)
+
+// spotifyLoad tracks an in-flight Spotify download so that concurrent requests for the same track share its result.
+type spotifyLoad struct {
+	done chan struct{}
+	path string
+	err  error
+}
+
+var (
+	spotifyLoadsMu sync.Mutex
+	spotifyLoads   = make(map[string]*spotifyLoad)
 )
 
 // processSpotify manages the download and decryption of Spotify tracks.
+// Concurrent calls for the same track ID share a single download instead of each streaming it from the CDN.
 // It returns the file path of the processed track or an error if any step fails.
 func (d *Download) processSpotify() (string, error) {
 	track := d.Track
-	downloadsDir := config.Conf.DownloadsDir
-
-	outputFile := filepath.Join(downloadsDir, fmt.Sprintf("%s.ogg", track.TC))
+	outputFile := filepath.Join(config.Conf.DownloadsDir, fmt.Sprintf("%s.ogg", track.TC))
 	if _, err := os.Stat(outputFile); err == nil {
 		log.Printf("✅ The file already exists: %s", outputFile)
 		return outputFile, nil
@@ -44,148 +54,159 @@ func (d *Download) processSpotify() (string, error) {
 		return "", errMissingKey
 	}
 
-	startTime := time.Now()
-	defer func() {
-		log.Printf("The process was completed in %s.", time.Since(startTime))
-	}()
+	spotifyLoadsMu.Lock()
+	if load, ok := spotifyLoads[track.TC]; ok {
+		spotifyLoadsMu.Unlock()
+		select {
+		case <-load.done:
+			return load.path, load.err
+		case <-d.ctx.Done():
+			return "", d.ctx.Err()
+		}
+	}
+	load := &spotifyLoad{done: make(chan struct{})}
+	spotifyLoads[track.TC] = load
+	spotifyLoadsMu.Unlock()
 
-	encryptedFile := filepath.Join(downloadsDir, fmt.Sprintf("%s.encrypted", track.TC))
-	decryptedFile := filepath.Join(downloadsDir, fmt.Sprintf("%s_decrypted.ogg", track.TC))
+	load.path, load.err = d.fetchSpotify(outputFile)
 
-	defer func() {
-		_ = os.Remove(encryptedFile)
-		_ = os.Remove(decryptedFile)
-	}()
+	spotifyLoadsMu.Lock()
+	delete(spotifyLoads, track.TC)
+	spotifyLoadsMu.Unlock()
+	close(load.done)
 
-	if err := d.downloadAndDecrypt(encryptedFile, decryptedFile); err != nil {
-		log.Printf("Failed to download and decrypt the file: %v", err)
-		return "", err
-	}
+	return load.path, load.err
+}
 
-	if err := rebuildOGG(decryptedFile); err != nil {
-		log.Printf("Failed to rebuild the OGG headers: %v", err)
-	}
+// fetchSpotify streams the encrypted track from the CDN, decrypts it, and has ffmpeg write it to outputFile.
+// It returns the file path of the processed track or an error if any step fails.
+func (d *Download) fetchSpotify(outputFile string) (string, error) {
+	track := d.Track
 
-	return fixOGG(decryptedFile, track)
-}
+	startTime := time.Now()
+	defer func() {
+		log.Printf("The process was completed in %s.", time.Since(startTime))
+	}()
 
-// downloadAndDecrypt handles the download and decryption of a file.
-// It takes the paths for the encrypted and decrypted files and returns an error if any step fails.
-func (d *Download) downloadAndDecrypt(encryptedPath, decryptedPath string) error {
-	resp, err := http.Get(d.Track.CdnURL)
+	body, err := d.openEncrypted()
 	if err != nil {
-		return fmt.Errorf("failed to download the file: %w", err)
+		log.Printf("Failed to download the file: %v", err)
+		return "", err
 	}
 	defer func(Body io.ReadCloser) {
 		_ = Body.Close()
-	}(resp.Body)
+	}(body)
 
-	if resp.StatusCode != http.StatusOK {
-		return fmt.Errorf("unexpected status code: %d", resp.StatusCode)
-	}
-
-	data, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return fmt.Errorf("failed to read the response body: %w", err)
-	}
-
-	if err := os.WriteFile(encryptedPath, data, defaultFilePerm); err != nil {
-		return fmt.Errorf("failed to write the encrypted file: %w", err)
-	}
-
-	decryptedData, decryptTime, err := decryptAudioFile(encryptedPath, d.Track.Key)
+	// The track is decrypted, header-patched, and piped into ffmpeg as it arrives, so neither the encrypted
+	// nor the decrypted audio is ever written to disk on its own.
+	audio, err := decryptAudio(body, track.Key)
 	if err != nil {
-		return fmt.Errorf("failed to decrypt the audio file: %w", err)
+		log.Printf("Failed to decrypt the file: %v", err)
+		return "", fmt.Errorf("failed to decrypt the audio file: %w", err)
 	}
-	log.Printf("Decryption was completed in %s.", decryptTime)
 
-	return os.WriteFile(decryptedPath, decryptedData, defaultFilePerm)
+	return fixOGG(d.ctx, audio, outputFile)
 }
 
-// decryptAudioFile decrypts an audio file using AES-CTR encryption.
-// It takes a file path and a hexadecimal key, and returns the decrypted data, decryption time, and any error encountered.
-func decryptAudioFile(filePath, hexKey string) ([]byte, string, error) {
-	// #nosec G304 - The file path is constructed internally and not from user input.
-	if _, err := os.Stat(filePath); os.IsNotExist(err) {
-		return nil, "", fmt.Errorf("%w: %s", errFileNotFound, filePath)
+// openEncrypted requests the encrypted track from its CDN URL and returns the response body.
+// The caller must close the body.
+func (d *Download) openEncrypted() (io.ReadCloser, error) {
+	req, err := http.NewRequestWithContext(d.ctx, http.MethodGet, d.Track.CdnURL, nil)
+	if err != nil {
+		return nil, fmt.Errorf("failed to create the request: %w", err)
 	}
-
-	key, err := hex.DecodeString(hexKey)
+	req.Header.Set("Accept-Encoding", "identity")
+	resp, err := downloadClient.Do(req)
 	if err != nil {
-		return nil, "", fmt.Errorf("%w: %v", errInvalidHexKey, err)
+		return nil, fmt.Errorf("failed to download the file: %w", err)
 	}
 
-	data, err := os.ReadFile(filePath)
-	if err != nil {
-		return nil, "", fmt.Errorf("failed to read the file: %w", err)
+	if resp.StatusCode != http.StatusOK {
+		_ = resp.Body.Close()
+		return nil, fmt.Errorf("unexpected status code: %d", resp.StatusCode)
 	}
+	return resp.Body, nil
+}
 
-	audioAesIv, err := hex.DecodeString("72e067fbddcbcf77ebe8bc643f630d93")
+// decryptAudio returns a reader of the decrypted contents of AES-CTR encrypted audio, with the OGG header already
+// rebuilt. CTR is a stream cipher, so the data is decrypted as it is read.
+// It takes the encrypted stream and a hexadecimal key.
+func decryptAudio(encrypted io.Reader, hexKey string) (io.Reader, error) {
+	key, err := hex.DecodeString(hexKey)
 	if err != nil {
-		return nil, "", fmt.Errorf("%w: %v", errInvalidAESIV, err)
+		return nil, fmt.Errorf("%w: %v", errInvalidHexKey, err)
 	}
 
 	block, err := aes.NewCipher(key)
 	if err != nil {
-		return nil, "", fmt.Errorf("failed to create the AES cipher: %w", err)
+		return nil, fmt.Errorf("failed to create the AES cipher: %w", err)
 	}
 
-	startTime := time.Now()
-	ctr := cipher.NewCTR(block, audioAesIv)
-	decrypted := make([]byte, len(data))
-	ctr.XORKeyStream(decrypted, data)
+	stream := cipher.StreamReader{S: cipher.NewCTR(block, audioAesIV), R: encrypted}
+	header := make([]byte, oggHeaderLen)
+	if _, err := io.ReadFull(stream, header); err != nil {
+		return nil, fmt.Errorf("failed to read the header: %w", err)
+	}
+	rebuildOGG(header)
 
-	return decrypted, fmt.Sprintf("%dms", time.Since(startTime).Milliseconds()), nil
+	return io.MultiReader(bytes.NewReader(header), stream), nil
 }
 
-// rebuildOGG reconstructs the OGG header of a given file by patching specific offsets.
-// This is necessary to make the decrypted file playable.
-func rebuildOGG(filename string) error {
-	// #nosec G304 - The filename is constructed internally.
-	file, err := os.OpenFile(filename, os.O_RDWR, defaultFilePerm)
-	if err != nil {
-		return fmt.Errorf("error opening the file: %w", err)
-	}
-	defer func(file *os.File) {
-		_ = file.Close()
-	}(file)
+// oggHeaderPatches are the fixed byte ranges rebuildOGG writes over the start of a decrypted file, in offset order.
+var oggHeaderPatches = []struct {
+	offset int
+	data   string
+}{
+	{0, "OggS"},
+	{6, "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"},
+	{26, "\x01\x1E\x01vorbis"},
+	{39, "\x02"},
+	{40, "\x44\xAC\x00\x00"},
+	{48, "\x00\xE2\x04\x00"},
+	{56, "\xB8\x01"},
+	{58, "OggS"},
+	{62, "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00"},
+}
 
-	writeAt := func(offset int64, data string) error {
-		_, err := file.WriteAt([]byte(data), offset)
-		return err
-	}
+// oggHeaderLen covers every patch in oggHeaderPatches.
+const oggHeaderLen = 72
 
-	// OGG header patch structure.
-	patches := map[int64]string{
-		0:  "OggS",
-		6:  "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
-		26: "\x01\x1E\x01vorbis",
-		39: "\x02",
-		40: "\x44\xAC\x00\x00",
-		48: "\x00\xE2\x04\x00",
-		56: "\xB8\x01",
-		58: "OggS",
-		62: "\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00",
+// rebuildOGG reconstructs the OGG header in the first oggHeaderLen decrypted bytes by patching specific offsets.
+// This is necessary to make the decrypted audio playable.
+func rebuildOGG(header []byte) {
+	for _, p := range oggHeaderPatches {
+		copy(header[p.offset:], p.data)
 	}
+}
 
-	for offset, data := range patches {
-		if err := writeAt(offset, data); err != nil {
-			return fmt.Errorf("failed to write at offset %d: %w", offset, err)
-		}
+// fixOGG pipes the decrypted audio through ffmpeg to correct any remaining issues, ensuring the output is playable.
+// ffmpeg writes to a unique temp file in the same directory, which is renamed to outputFile only once ffmpeg succeeds,
+// so outputFile never holds a partial track, even if the process dies mid-stream.
+// It returns the final output file path or an error.
+func fixOGG(ctx context.Context, audio io.Reader, outputFile string) (string, error) {
+	tmp, err := os.CreateTemp(filepath.Dir(outputFile), filepath.Base(outputFile)+".*.part")
+	if err != nil {
+		return "", fmt.Errorf("failed to create the temporary file: %w", err)
 	}
+	tempPath := tmp.Name()
+	_ = tmp.Close()
+	defer func() {
+		_ = os.Remove(tempPath) // No-op once the file has been renamed.
+	}()
 
-	return nil
-}
-
-// fixOGG uses ffmpeg to correct any remaining issues in the OGG file, ensuring it is playable.
-// It takes the input file path and track information, and returns the final output file path or an error.
-func fixOGG(inputFile string, track cache.TrackInfo) (string, error) {
-	outputFile := filepath.Join(config.Conf.DownloadsDir, fmt.Sprintf("%s.ogg", track.TC))
-	// #nosec G204 - The input file path is trusted as it's generated internally.
-	cmd := exec.Command("ffmpeg", "-i", inputFile, "-c", "copy", outputFile)
+	// The temp name does not end in .ogg, so the output format is given explicitly.
+	// #nosec G204 - The file paths are trusted as they're generated internally.
+	cmd := exec.CommandContext(ctx, "ffmpeg", "-y", "-f", "ogg", "-i", "pipe:0", "-c", "copy", "-f", "ogg", tempPath)
+	cmd.Stdin = audio
 	if output, err := cmd.CombinedOutput(); err != nil {
 		return "", fmt.Errorf("ffmpeg failed with error: %w\nOutput: %s", err, string(output))
 	}
 
+	if err := os.Chmod(tempPath, 0644); err != nil {
+		return "", fmt.Errorf("failed to set the file mode: %w", err)
+	}
+	if err := os.Rename(tempPath, outputFile); err != nil {
+		return "", fmt.Errorf("failed to rename the temporary file: %w", err)
+	}
 	return outputFile, nil
 }
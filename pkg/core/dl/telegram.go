@@ -9,6 +9,13 @@ import (
 	tg "github.com/amarnathcjd/gogram/telegram"
 )
 
+var (
+	// publicMsgURLRegex matches public channel message URLs, e.g. https://t.me/ChannelName/1234.
+	publicMsgURLRegex = regexp.MustCompile(`^https?://t\.me/([a-zA-Z0-9_]{4,})/(\d+)$`)
+	// privateMsgURLRegex matches private or supergroup message URLs, e.g. https://t.me/c/12345678/90.
+	privateMsgURLRegex = regexp.MustCompile(`^https?://t\.me/c/(\d+)/(\d+)$`)
+)
+
 // GetMessage retrieves a Telegram message by its URL.
 // It supports both public (e.g., https://t.me/ChannelName/1234) and private (e.g., https://t.me/c/12345678/90) URLs.
 // It returns the message object or an error if the URL is invalid or the message cannot be fetched.
@@ -19,9 +26,7 @@ func GetMessage(client *tg.Client, url string) (*tg.NewMessage, error) {
 	}
 
 	parseTelegramURL := func(input string) (username string, chatID int64, msgID int, isPrivate bool, ok bool) {
-		// Regular expression for public channel URLs.
-		publicRe := regexp.MustCompile(`^https?://t\.me/([a-zA-Z0-9_]{4,})/(\d+)$`)
-		if matches := publicRe.FindStringSubmatch(input); matches != nil {
+		if matches := publicMsgURLRegex.FindStringSubmatch(input); matches != nil {
 			id, err := strconv.Atoi(matches[2])
 			if err != nil {
 				return "", 0, 0, false, false
@@ -29,9 +34,7 @@ func GetMessage(client *tg.Client, url string) (*tg.NewMessage, error) {
 			return matches[1], 0, id, false, true
 		}
 
-		// Regular expression for private or supergroup channel URLs.
-		privateRe := regexp.MustCompile(`^https?://t\.me/c/(\d+)/(\d+)$`)
-		if matches := privateRe.FindStringSubmatch(input); matches != nil {
+		if matches := privateMsgURLRegex.FindStringSubmatch(input); matches != nil {
 			chat, err1 := strconv.ParseInt(matches[1], 10, 64)
 			msg, err2 := strconv.Atoi(matches[2])
 			if err1 != nil || err2 != nil {
@@ -16,32 +16,37 @@ import (
 	"strings"
 )
 
+// youtubeURLPatterns match watch, youtu.be, and shorts URLs, capturing the video ID in the first group.
+// They are compiled once at start-up and kept in a slice, so matching iterates them in a fixed order without map overhead.
+var youtubeURLPatterns = []*regexp.Regexp{
+	regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([\w-]{11})(?:[&#?].*)?$`),
+	regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtu\.be/([\w-]{11})(?:[?#].*)?$`),
+	regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtube\.com/shorts/([\w-]{11})(?:[?#].*)?$`),
+}
+
 // YouTubeData provides an interface for fetching track and playlist information from YouTube.
 type YouTubeData struct {
-	Query    string
-	ApiUrl   string
-	APIKey   string
-	Patterns map[string]*regexp.Regexp
+	Query  string
+	ApiUrl string
+	APIKey string
+	// validated and videoID memoize the URL match, which IsValid, GetInfo, and GetTrack would otherwise repeat.
+	validated bool
+	videoID   string
 }
 
-// NewYouTubeData initializes a YouTubeData instance with pre-compiled regex patterns and a cleaned query.
+// NewYouTubeData initializes a YouTubeData instance with a cleaned query.
 func NewYouTubeData(query string) *YouTubeData {
 	return &YouTubeData{
 		Query:  clearQuery(query),
 		ApiUrl: strings.TrimRight(config.Conf.ApiUrl, "/"),
 		APIKey: config.Conf.ApiKey,
-		Patterns: map[string]*regexp.Regexp{
-			"youtube":   regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([\w-]{11})(?:[&#?].*)?$`),
-			"youtu_be":  regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtu\.be/([\w-]{11})(?:[?#].*)?$`),
-			"yt_shorts": regexp.MustCompile(`^(?:https?://)?(?:www\.)?youtube\.com/shorts/([\w-]{11})(?:[?#].*)?$`),
-		},
 	}
 }
 
 // clearQuery removes extraneous URL parameters and fragments from a given query string.
 func clearQuery(query string) string {
-	query = strings.SplitN(query, "#", 2)[0]
-	query = strings.SplitN(query, "&", 2)[0]
+	query, _, _ = strings.Cut(query, "#")
+	query, _, _ = strings.Cut(query, "&")
 	return strings.TrimSpace(query)
 }
 
@@ -51,58 +56,59 @@ func (y *YouTubeData) normalizeYouTubeURL(url string) string {
 		return ""
 	}
 
-	if strings.Contains(url, "youtu.be/") {
-		parts := strings.SplitN(strings.SplitN(url, "youtu.be/", 2)[1], "?", 2)
-		videoID := strings.SplitN(parts[0], "#", 2)[0]
-		return "https://www.youtube.com/watch?v=" + videoID
+	if _, rest, ok := strings.Cut(url, "youtu.be/"); ok {
+		return "https://www.youtube.com/watch?v=" + videoIDPrefix(rest)
 	}
 
-	if strings.Contains(url, "youtube.com/shorts/") {
-		parts := strings.SplitN(strings.SplitN(url, "youtube.com/shorts/", 2)[1], "?", 2)
-		videoID := strings.SplitN(parts[0], "#", 2)[0]
-		return "https://www.youtube.com/watch?v=" + videoID
+	if _, rest, ok := strings.Cut(url, "youtube.com/shorts/"); ok {
+		return "https://www.youtube.com/watch?v=" + videoIDPrefix(rest)
 	}
 
 	return url
 }
 
-// extractVideoID parses a YouTube URL and extracts the video ID.
-func (y *YouTubeData) extractVideoID(url string) string {
-	url = y.normalizeYouTubeURL(url)
-	for _, pattern := range y.Patterns {
-		if match := pattern.FindStringSubmatch(url); len(match) > 1 {
-			return match[1]
-		}
-	}
-	return ""
+// videoIDPrefix returns the part of a URL path before any query string or fragment.
+func videoIDPrefix(rest string) string {
+	rest, _, _ = strings.Cut(rest, "?")
+	rest, _, _ = strings.Cut(rest, "#")
+	return rest
 }
 
-// IsValid checks if the query string matches any of the known YouTube URL patterns.
-func (y *YouTubeData) IsValid() bool {
+// extractVideoID returns the video ID of the query, or "" if it is not a YouTube URL.
+// The patterns are matched only on the first call.
+func (y *YouTubeData) extractVideoID() string {
+	if y.validated {
+		return y.videoID
+	}
+	y.validated = true
+
 	if y.Query == "" {
 		log.Println("The query or patterns are empty.")
-		return false
+		return ""
 	}
-	for _, pattern := range y.Patterns {
-		if pattern.MatchString(y.Query) {
-			return true
+	for _, pattern := range youtubeURLPatterns {
+		if match := pattern.FindStringSubmatch(y.Query); len(match) > 1 {
+			y.videoID = match[1]
+			break
 		}
 	}
-	return false
+	return y.videoID
+}
+
+// IsValid checks if the query string matches any of the known YouTube URL patterns.
+func (y *YouTubeData) IsValid() bool {
+	return y.extractVideoID() != ""
 }
 
 // GetInfo retrieves metadata for a track from YouTube.
 // It returns a PlatformTracks object or an error if the information cannot be fetched.
 func (y *YouTubeData) GetInfo(ctx context.Context) (cache.PlatformTracks, error) {
-	if !y.IsValid() {
+	videoID := y.extractVideoID()
+	if videoID == "" {
 		return cache.PlatformTracks{}, errors.New("the provided URL is invalid or the platform is not supported")
 	}
 
 	y.Query = y.normalizeYouTubeURL(y.Query)
-	videoID := y.extractVideoID(y.Query)
-	if videoID == "" {
-		return cache.PlatformTracks{}, errors.New("unable to extract the video ID")
-	}
 
 	tracks, err := searchYouTube(y.Query)
 	if err != nil {
@@ -183,30 +189,35 @@ func (y *YouTubeData) downloadTrack(ctx context.Context, info cache.TrackInfo, v
 	return filePath, err
 }
 
+// ytdlpBaseParams are the yt-dlp arguments shared by every download.
+var ytdlpBaseParams = []string{
+	"yt-dlp",
+	"--no-warnings",
+	"--quiet",
+	"--geo-bypass",
+	"--retries", "2",
+	"--continue",
+	"--no-part",
+	"--concurrent-fragments", "3",
+	"--socket-timeout", "10",
+	"--throttled-rate", "100K",
+	"--retry-sleep", "1",
+	"--no-write-thumbnail",
+	"--no-write-info-json",
+	"--no-embed-metadata",
+	"--no-embed-chapters",
+	"--no-embed-subs",
+}
+
 // BuildYtdlpParams constructs the command-line parameters for yt-dlp to download media.
 // It takes a video ID and a boolean indicating whether to download video or audio, and returns the corresponding parameters.
 func (y *YouTubeData) BuildYtdlpParams(videoID string, video bool) []string {
 	outputTemplate := filepath.Join(config.Conf.DownloadsDir, "%(id)s.%(ext)s")
 
-	params := []string{
-		"yt-dlp",
-		"--no-warnings",
-		"--quiet",
-		"--geo-bypass",
-		"--retries", "2",
-		"--continue",
-		"--no-part",
-		"--concurrent-fragments", "3",
-		"--socket-timeout", "10",
-		"--throttled-rate", "100K",
-		"--retry-sleep", "1",
-		"--no-write-thumbnail",
-		"--no-write-info-json",
-		"--no-embed-metadata",
-		"--no-embed-chapters",
-		"--no-embed-subs",
-		"-o", outputTemplate,
-	}
+	// Room for the output, format, merge, cookie/proxy and URL arguments appended below.
+	params := make([]string, 0, len(ytdlpBaseParams)+12)
+	params = append(params, ytdlpBaseParams...)
+	params = append(params, "-o", outputTemplate)
 
 	formatSelector := "bestaudio[ext=m4a]/bestaudio[ext=mp4]/bestaudio[ext=webm]/bestaudio/best"
 	if video {
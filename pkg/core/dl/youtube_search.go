@@ -1,6 +1,7 @@
 package dl
 
 import (
+	"bytes"
 	"encoding/json"
 	"fmt"
 	"github.com/zuchzub/Go/pkg/core/cache"
@@ -10,102 +11,147 @@ import (
 	"strings"
 )
 
+var ytInitialDataRegex = regexp.MustCompile(`var ytInitialData = (.*?);\s*</script>`)
+
 // searchYouTube scrapes YouTube results page
 func searchYouTube(query string) ([]cache.MusicTrack, error) {
 	query = strings.ReplaceAll(query, " ", "+")
 	url := "https://www.youtube.com/results?search_query=" + query
 	req, _ := http.NewRequest("GET", url, nil)
 	req.Header.Set("User-Agent", "Mozilla/5.0 (X11; Linux x86_64)")
-	resp, err := http.DefaultClient.Do(req)
+	resp, err := client.Do(req)
 	if err != nil {
 		return nil, err
 	}
 	defer resp.Body.Close()
 	body, _ := io.ReadAll(resp.Body)
 
-	re := regexp.MustCompile(`var ytInitialData = (.*?);\s*</script>`)
-	match := re.FindSubmatch(body)
+	match := ytInitialDataRegex.FindSubmatch(body)
 	if len(match) < 2 {
 		return nil, fmt.Errorf("ytInitialData not found")
 	}
 
-	var data map[string]interface{}
+	var data ytInitialData
 	if err := json.Unmarshal(match[1], &data); err != nil {
 		return nil, err
 	}
 
-	// Navigate nested fields
-	contents := dig(data, "contents", "twoColumnSearchResultsRenderer",
-		"primaryContents", "sectionListRenderer", "contents")
-
-	if contents == nil {
+	contents := data.Contents.TwoColumnSearchResultsRenderer.PrimaryContents.SectionListRenderer.Contents
+	if len(contents) == 0 || string(contents) == "null" {
 		return nil, fmt.Errorf("no contents")
 	}
 
 	var tracks []cache.MusicTrack
-	parseSearchResults(contents, &tracks)
+	if err := parseSearchResults(contents, &tracks); err != nil {
+		return nil, err
+	}
 
 	return tracks, nil
 }
 
-// Recursively find items
-func parseSearchResults(node interface{}, tracks *[]cache.MusicTrack) {
-	switch v := node.(type) {
-	case []interface{}:
-		for _, item := range v {
-			parseSearchResults(item, tracks)
+// ytInitialData declares only the path to the search results, so the rest of the page data is skipped
+// while decoding rather than materialised as nested maps.
+type ytInitialData struct {
+	Contents struct {
+		TwoColumnSearchResultsRenderer struct {
+			PrimaryContents struct {
+				SectionListRenderer struct {
+					Contents json.RawMessage `json:"contents"`
+				} `json:"sectionListRenderer"`
+			} `json:"primaryContents"`
+		} `json:"twoColumnSearchResultsRenderer"`
+	} `json:"contents"`
+}
+
+type ytText struct {
+	Runs []struct {
+		Text string `json:"text"`
+	} `json:"runs"`
+	SimpleText string `json:"simpleText"`
+}
+
+type ytVideoRenderer struct {
+	VideoID   string `json:"videoId"`
+	Title     ytText `json:"title"`
+	Thumbnail struct {
+		Thumbnails []struct {
+			URL string `json:"url"`
+		} `json:"thumbnails"`
+	} `json:"thumbnail"`
+	LengthText ytText `json:"lengthText"`
+}
+
+// ytFrame is one level of JSON nesting seen by parseSearchResults; wantKey is set while an object awaits its next key.
+type ytFrame struct {
+	object  bool
+	wantKey bool
+}
+
+// parseSearchResults finds every videoRenderer in contents at any depth, in document order, whatever container
+// YouTube wraps it in (item sections, shelves, rich items, ...). It walks the JSON as a token stream, so only the
+// video renderers themselves are decoded and no container is materialised as a map.
+func parseSearchResults(contents json.RawMessage, tracks *[]cache.MusicTrack) error {
+	dec := json.NewDecoder(bytes.NewReader(contents))
+	var stack []ytFrame
+	for {
+		tok, err := dec.Token()
+		if err == io.EOF {
+			return nil
 		}
-	case map[string]interface{}:
-		if vid, ok := dig(v, "videoRenderer").(map[string]interface{}); ok {
-			id := safeString(vid["videoId"])
-			title := safeString(dig(vid, "title", "runs", 0, "text"))
-			thumb := safeString(dig(vid, "thumbnail", "thumbnails", 0, "url"))
-			durationText := safeString(dig(vid, "lengthText", "simpleText"))
-			duration := parseDuration(durationText)
-			*tracks = append(*tracks, cache.MusicTrack{
-				URL:      "https://www.youtube.com/watch?v=" + id,
-				Name:     title,
-				ID:       id,
-				Cover:    thumb,
-				Duration: duration,
-				Platform: "youtube",
-			})
-		} else {
-			for _, child := range v {
-				parseSearchResults(child, tracks)
+		if err != nil {
+			return err
+		}
+
+		top := len(stack) - 1
+		if key, ok := tok.(string); ok && top >= 0 && stack[top].wantKey {
+			stack[top].wantKey = false
+			if key == "videoRenderer" {
+				var vid ytVideoRenderer
+				if err := dec.Decode(&vid); err != nil {
+					return err
+				}
+				*tracks = append(*tracks, vid.track())
+				stack[top].wantKey = true
 			}
+			continue
 		}
-	}
-}
 
-// safely dig into nested JSON
-func dig(m interface{}, path ...interface{}) interface{} {
-	curr := m
-	for _, p := range path {
-		switch key := p.(type) {
-		case string:
-			if mm, ok := curr.(map[string]interface{}); ok {
-				curr = mm[key]
-			} else {
-				return nil
+		switch tok {
+		case json.Delim('{'):
+			stack = append(stack, ytFrame{object: true, wantKey: true})
+		case json.Delim('['):
+			stack = append(stack, ytFrame{})
+		case json.Delim('}'), json.Delim(']'):
+			stack = stack[:top]
+			if top > 0 && stack[top-1].object {
+				stack[top-1].wantKey = true
 			}
-		case int:
-			if arr, ok := curr.([]interface{}); ok && len(arr) > key {
-				curr = arr[key]
-			} else {
-				return nil
+		default:
+			// A scalar value; in an object the next token is a key again.
+			if top >= 0 && stack[top].object {
+				stack[top].wantKey = true
 			}
 		}
 	}
-	return curr
 }
 
-// safely cast to string
-func safeString(v interface{}) string {
-	if s, ok := v.(string); ok {
-		return s
+// track converts a video renderer into a MusicTrack.
+func (vid *ytVideoRenderer) track() cache.MusicTrack {
+	var title, thumb string
+	if len(vid.Title.Runs) > 0 {
+		title = vid.Title.Runs[0].Text
+	}
+	if len(vid.Thumbnail.Thumbnails) > 0 {
+		thumb = vid.Thumbnail.Thumbnails[0].URL
+	}
+	return cache.MusicTrack{
+		URL:      "https://www.youtube.com/watch?v=" + vid.VideoID,
+		Name:     title,
+		ID:       vid.VideoID,
+		Cover:    thumb,
+		Duration: parseDuration(vid.LengthText.SimpleText),
+		Platform: "youtube",
 	}
-	return ""
 }
 
 // parse duration like "3:45" -> 225 seconds
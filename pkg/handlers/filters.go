@@ -1,11 +1,12 @@
 package handlers
 
 import (
+	"context"
+	"errors"
 	"github.com/zuchzub/Go/pkg/config"
 	"github.com/zuchzub/Go/pkg/core/cache"
 	"github.com/zuchzub/Go/pkg/core/db"
 	"github.com/zuchzub/Go/pkg/lang"
-	"strings"
 
 	"github.com/Laky-64/gologging"
 	"github.com/amarnathcjd/gogram/telegram"
@@ -23,130 +24,121 @@ func isDev(m *telegram.NewMessage) bool {
 	return false
 }
 
-// adminMode checks if the bot is an admin in the chat.
-// It takes a telegram.NewMessage object as input.
-// It checks if the bot is an admin in the chat.
-// Handle Admin Mode
-// It returns true if the bot is an admin, otherwise false.
-func adminMode(m *telegram.NewMessage) bool {
-	if m.IsPrivate() {
-		return false
+// loadBotStatus starts loading the bot's admin entry for a chat in the background, so that the Telegram request
+// overlaps with the database reads a filter performs meanwhile.
+// It returns a function that blocks until the result is available.
+func loadBotStatus(client *telegram.Client, chatID int64) func() (*telegram.Participant, error) {
+	type result struct {
+		status *telegram.Participant
+		err    error
 	}
-	chatID, err := getPeerId(m.Client, m.ChatID())
-	if err != nil {
-		gologging.WarnF("getPeerId error: %v", err)
-		return false
+
+	ch := make(chan result, 1)
+	go func() {
+		status, err := cache.GetUserAdmin(client, chatID, client.Me().ID, false)
+		ch <- result{status, err}
+	}()
+
+	return func() (*telegram.Participant, error) {
+		res := <-ch
+		return res.status, res.err
 	}
-	ctx, cancel := db.Ctx()
-	defer cancel()
-	langCode := db.Instance.GetLang(ctx, chatID)
+}
 
-	botStatus, err := cache.GetUserAdmin(m.Client, chatID, m.Client.Me().ID, false)
+// botStatusDenial checks the result of loading the bot's admin entry for a chat.
+// It returns the language key of the message explaining why the bot cannot act, or an empty string if it can.
+func botStatusDenial(botStatus *telegram.Participant, err error) string {
 	if err != nil {
-		if strings.Contains(err.Error(), "is not an admin in chat") {
-			_, _ = m.Reply(lang.GetString(langCode, "filter_bot_not_admin"))
-			return false
+		if errors.Is(err, cache.ErrNotAdmin) {
+			return "filter_bot_not_admin"
 		}
-
 		gologging.WarnF("GetUserAdmin error: %v", err)
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_admin_status_failed"))
-		return false
+		return "filter_bot_admin_status_failed"
 	}
 
 	if botStatus.Status != telegram.Admin && botStatus.Status != telegram.Creator {
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_not_admin_reload"))
-		return false
+		return "filter_bot_not_admin_reload"
 	}
 
 	if botStatus.Rights != nil && !botStatus.Rights.InviteUsers {
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_no_invite_permission"))
-		return false
-	}
-	userID := m.SenderID()
-
-	getAdminMode := db.Instance.GetAdminMode(ctx, chatID)
-	if getAdminMode == cache.Everyone {
-		return true
+		return "filter_bot_no_invite_permission"
 	}
+	return ""
+}
 
-	if getAdminMode == cache.Admins {
+// adminModeDenial checks a user against the admin mode of a chat.
+// It returns the language key of the message explaining why the user is not allowed, or an empty string if they are.
+func adminModeDenial(ctx context.Context, chatID, userID int64) string {
+	switch db.Instance.GetAdminMode(ctx, chatID) {
+	case cache.Everyone:
+		return ""
+	case cache.Admins:
 		if db.Instance.IsAdmin(ctx, chatID, userID) {
-			return true
+			return ""
 		}
-		_, _ = m.Reply(lang.GetString(langCode, "filter_not_admin"))
-		return false
-	}
-
-	if getAdminMode == cache.Auth {
+		return "filter_not_admin"
+	case cache.Auth:
 		if db.Instance.IsAuthUser(ctx, chatID, userID) {
-			return true
+			return ""
 		}
-		_, _ = m.Reply(lang.GetString(langCode, "filter_not_authorized"))
-		return false
 	}
-
-	_, _ = m.Reply(lang.GetString(langCode, "filter_not_authorized"))
-	return false
+	return "filter_not_authorized"
 }
 
-func adminModeCB(cb *telegram.CallbackQuery) bool {
-	chatID, err := getPeerId(cb.Client, cb.ChatID)
+// adminMode checks if the bot is an admin in the chat and if the sender is allowed by the chat's admin mode.
+// It takes a telegram.NewMessage object as input.
+// It returns true if the command may run, otherwise false.
+func adminMode(m *telegram.NewMessage) bool {
+	if m.IsPrivate() {
+		return false
+	}
+	chatID, err := getPeerId(m.Client, m.ChatID())
 	if err != nil {
 		gologging.WarnF("getPeerId error: %v", err)
 		return false
 	}
 	ctx, cancel := db.Ctx()
 	defer cancel()
+	waitBotStatus := loadBotStatus(m.Client, chatID)
 	langCode := db.Instance.GetLang(ctx, chatID)
 
-	botStatus, err := cache.GetUserAdmin(cb.Client, chatID, cb.Client.Me().ID, false)
-	opts := &telegram.CallbackOptions{Alert: true}
-
-	if err != nil {
-		if strings.Contains(err.Error(), "is not an admin in chat") {
-			_, _ = cb.Answer(lang.GetString(langCode, "filter_bot_not_admin"), opts)
-			return false
-		}
-
-		gologging.WarnF("GetUserAdmin error: %v", err)
-		_, _ = cb.Answer(lang.GetString(langCode, "filter_bot_admin_status_failed"), opts)
+	if key := botStatusDenial(waitBotStatus()); key != "" {
+		_, _ = m.Reply(lang.GetString(langCode, key))
 		return false
 	}
 
-	if botStatus.Status != telegram.Admin && botStatus.Status != telegram.Creator {
-		_, _ = cb.Answer(lang.GetString(langCode, "filter_bot_not_admin_reload"), opts)
+	if key := adminModeDenial(ctx, chatID, m.SenderID()); key != "" {
+		_, _ = m.Reply(lang.GetString(langCode, key))
 		return false
 	}
+	return true
+}
 
-	if botStatus.Rights != nil && !botStatus.Rights.InviteUsers {
-		_, _ = cb.Answer(lang.GetString(langCode, "filter_bot_no_invite_permission"), opts)
+// adminModeCB is the callback query counterpart of adminMode.
+func adminModeCB(cb *telegram.CallbackQuery) bool {
+	if cb.IsPrivate() {
 		return false
 	}
-	userID := cb.SenderID
-
-	getAdminMode := db.Instance.GetAdminMode(ctx, chatID)
-	if getAdminMode == cache.Everyone {
-		return true
+	chatID, err := getPeerId(cb.Client, cb.ChatID)
+	if err != nil {
+		gologging.WarnF("getPeerId error: %v", err)
+		return false
 	}
+	ctx, cancel := db.Ctx()
+	defer cancel()
+	waitBotStatus := loadBotStatus(cb.Client, chatID)
+	langCode := db.Instance.GetLang(ctx, chatID)
 
-	if getAdminMode == cache.Admins {
-		if db.Instance.IsAdmin(ctx, chatID, userID) {
-			return true
-		}
-		_, _ = cb.Answer(lang.GetString(langCode, "filter_not_admin"), opts)
+	if key := botStatusDenial(waitBotStatus()); key != "" {
+		_, _ = cb.Answer(lang.GetString(langCode, key), alertOpts)
 		return false
 	}
 
-	if getAdminMode == cache.Auth {
-		if db.Instance.IsAuthUser(ctx, chatID, userID) {
-			return true
-		}
-		_, _ = cb.Answer(lang.GetString(langCode, "filter_not_authorized"), opts)
+	if key := adminModeDenial(ctx, chatID, cb.SenderID); key != "" {
+		_, _ = cb.Answer(lang.GetString(langCode, key), alertOpts)
 		return false
 	}
-
-	_, _ = cb.Answer(lang.GetString(langCode, "filter_not_authorized"), opts)
-	return false
+	return true
 }
 
 func playMode(m *telegram.NewMessage) bool {
@@ -160,51 +152,24 @@ func playMode(m *telegram.NewMessage) bool {
 	}
 	ctx, cancel := db.Ctx()
 	defer cancel()
+	waitBotStatus := loadBotStatus(m.Client, chatID)
 	langCode := db.Instance.GetLang(ctx, chatID)
-	botStatus, err := cache.GetUserAdmin(m.Client, chatID, m.Client.Me().ID, false)
-	if err != nil {
-		if strings.Contains(err.Error(), "is not an admin in chat") {
-			_, _ = m.Reply(lang.GetString(langCode, "filter_bot_not_admin"))
-			return false
-		}
-
-		gologging.WarnF("GetUserAdmin error: %v", err)
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_admin_status_failed"))
+	if key := botStatusDenial(waitBotStatus()); key != "" {
+		_, _ = m.Reply(lang.GetString(langCode, key))
 		return false
 	}
 
-	if botStatus.Status != telegram.Admin && botStatus.Status != telegram.Creator {
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_not_admin_reload"))
-		return false
-	}
-
-	if botStatus.Rights != nil && !botStatus.Rights.InviteUsers {
-		_, _ = m.Reply(lang.GetString(langCode, "filter_bot_no_invite_permission"))
-		return false
-	}
 	getPlayMode := db.Instance.GetPlayMode(ctx, chatID)
 	if getPlayMode != cache.Everyone {
-		admins, err := cache.GetAdmins(m.Client, chatID, false)
+		admin, err := cache.LookupAdmin(m.Client, chatID, m.Sender.ID)
 		if err != nil {
-			gologging.WarnF("getAdmins error: %v", err)
+			gologging.WarnF("LookupAdmin error: %v", err)
 			return false
 		}
 
-		var isAdmin bool
-		for _, admin := range admins {
-			if admin.User.ID == m.Sender.ID {
-				isAdmin = true
-				break
-			}
-		}
-
-		if !isAdmin {
-			if getPlayMode == cache.Auth {
-				if !db.Instance.IsAuthUser(ctx, chatID, m.Sender.ID) {
-					_, _ = m.Reply(lang.GetString(langCode, "filter_not_authorized_command"))
-					return false
-				}
-			} else {
+		if admin == nil {
+			// The admin list was already consulted above, so only the stored auth list remains to be checked.
+			if getPlayMode != cache.Auth || !db.Instance.InAuthList(ctx, chatID, m.Sender.ID) {
 				_, _ = m.Reply(lang.GetString(langCode, "filter_not_authorized_command"))
 				return false
 			}
@@ -55,27 +55,27 @@ func helpCallbackHandler(cb *telegram.CallbackQuery) error {
 	langCode := db.Instance.GetLang(ctx, chatID)
 	helpCategories := getHelpCategories(langCode)
 	if strings.Contains(data, "help_all") {
-		_, _ = cb.Answer(lang.GetString(langCode, "opening_help_menu"), &telegram.CallbackOptions{Alert: true})
+		_, _ = cb.Answer(lang.GetString(langCode, "opening_help_menu"), alertOpts)
 		response := fmt.Sprintf(lang.GetString(langCode, "start_text"), cb.Sender.FirstName, cb.Client.Me().FirstName)
 		_, _ = cb.Edit(response, &telegram.SendOptions{ReplyMarkup: core.HelpMenuKeyboard()})
 		return nil
 	}
 
 	if strings.Contains(data, "help_back") {
-		_, _ = cb.Answer(lang.GetString(langCode, "returning_to_home"), &telegram.CallbackOptions{Alert: true})
+		_, _ = cb.Answer(lang.GetString(langCode, "returning_to_home"), alertOpts)
 		response := fmt.Sprintf(lang.GetString(langCode, "start_text"), cb.Sender.FirstName, cb.Client.Me().FirstName)
 		_, _ = cb.Edit(response, &telegram.SendOptions{ReplyMarkup: core.AddMeMarkup(cb.Client.Me().Username)})
 		return nil
 	}
 
 	if category, ok := helpCategories[data]; ok {
-		_, _ = cb.Answer(fmt.Sprintf(lang.GetString(langCode, "opening_category"), category.Title), &telegram.CallbackOptions{Alert: true})
+		_, _ = cb.Answer(fmt.Sprintf(lang.GetString(langCode, "opening_category"), category.Title), alertOpts)
 		text := fmt.Sprintf(lang.GetString(langCode, "help_category_text"), category.Title, category.Content)
 		_, _ = cb.Edit(text, &telegram.SendOptions{ReplyMarkup: category.Markup})
 		return nil
 	}
 
-	_, _ = cb.Answer(lang.GetString(langCode, "unknown_command_category"), &telegram.CallbackOptions{Alert: true})
+	_, _ = cb.Answer(lang.GetString(langCode, "unknown_command_category"), alertOpts)
 	return nil
 }
 
@@ -7,6 +7,9 @@ import (
 	"github.com/amarnathcjd/gogram/telegram"
 )
 
+// alertOpts is shared by every callback answer that should be shown as an alert.
+var alertOpts = &telegram.CallbackOptions{Alert: true}
+
 // getPeerId gets the peer ID from a chat ID.
 // It takes a telegram client and a chat ID as input.
 // It returns the peer ID and an error if any.
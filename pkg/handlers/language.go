@@ -40,7 +40,7 @@ func setLangCallbackHandler(c *telegram.CallbackQuery) error {
 	}
 
 	if !isValidLang {
-		_, err := c.Answer("❌ Unsupported language code", &telegram.CallbackOptions{Alert: true})
+		_, err := c.Answer("❌ Unsupported language code", alertOpts)
 		return err
 	}
 
@@ -51,26 +51,19 @@ func setLangCallbackHandler(c *telegram.CallbackQuery) error {
 	if c.IsPrivate() {
 		_ = db.Instance.SetUserLang(ctx, chatID, langCode)
 	} else {
-		admins, err := cache.GetAdmins(c.Client, chatID, false)
+		admin, err := cache.LookupAdmin(c.Client, chatID, c.Sender.ID)
 		if err != nil {
 			return err
 		}
-		var isAdmin bool
-		for _, admin := range admins {
-			if admin.User.ID == c.Sender.ID {
-				isAdmin = true
-				break
-			}
-		}
-		if !isAdmin {
-			_, err := c.Answer(lang.GetString(langCode, "lang_no_permission"), &telegram.CallbackOptions{Alert: true})
+		if admin == nil {
+			_, err := c.Answer(lang.GetString(langCode, "lang_no_permission"), alertOpts)
 			return err
 		}
 
 		_ = db.Instance.SetChatLang(ctx, chatID, langCode)
 	}
 
-	_, _ = c.Answer(fmt.Sprintf(lang.GetString(langCode, "lang_updated"), langCode), &telegram.CallbackOptions{Alert: true})
+	_, _ = c.Answer(fmt.Sprintf(lang.GetString(langCode, "lang_updated"), langCode), alertOpts)
 	_, err := c.Edit(fmt.Sprintf(lang.GetString(langCode, "lang_changed"), langCode))
 	return err
 }
@@ -7,6 +7,8 @@ import (
 	"github.com/amarnathcjd/gogram/telegram"
 )
 
+// startTime records when the handlers package was initialised.
+// time.Since measures against its monotonic clock reading, so reported uptime is unaffected by wall-clock adjustments.
 var startTime = time.Now()
 
 // LoadModules loads all the handlers.
@@ -21,6 +21,9 @@ import (
 	"github.com/amarnathcjd/gogram/telegram"
 )
 
+// tgMessageURLRegex matches public Telegram message links such as https://t.me/ChannelName/1234.
+var tgMessageURLRegex = regexp.MustCompile(`^https://t\.me/([a-zA-Z0-9_]{4,})/(\d+)$`)
+
 // statusUpdater is a wrapper around telegram.NewMessage to prevent flood waits.
 type statusUpdater struct {
 	*telegram.NewMessage
@@ -66,7 +69,7 @@ func handlePlay(m *telegram.NewMessage, isVideo bool) error {
 	ctx, cancel := db.Ctx()
 	defer cancel()
 	langCode := db.Instance.GetLang(ctx, chatID)
-	if queue := cache.ChatCache.GetQueue(chatID); len(queue) > 10 {
+	if cache.ChatCache.GetQueueLength(chatID) > 10 {
 		_, err := m.Reply(lang.GetString(langCode, "play_queue_full"))
 		return err
 	}
@@ -78,8 +81,7 @@ func handlePlay(m *telegram.NewMessage, isVideo bool) error {
 	var err error
 
 	parseTelegramURL := func(input string) (string, int, bool) {
-		re := regexp.MustCompile(`^https://t\.me/([a-zA-Z0-9_]{4,})/(\d+)$`)
-		matches := re.FindStringSubmatch(input)
+		matches := tgMessageURLRegex.FindStringSubmatch(input)
 		if matches == nil {
 			return "", 0, false
 		}
@@ -105,11 +107,10 @@ func handlePlay(m *telegram.NewMessage, isVideo bool) error {
 		}
 	}
 
-	if isValid := isValidMedia(rMsg); isValid {
-		isReply = true
-	}
+	// Check the media once; the usage check and the dispatch below both depend on it.
+	hasMedia := isValidMedia(rMsg)
 
-	if url == "" && args == "" && (!isReply || !isValidMedia(rMsg)) {
+	if url == "" && args == "" && !hasMedia {
 		_, err := m.Reply(lang.GetString(langCode, "play_usage"), telegram.SendOptions{ReplyMarkup: core.SupportKeyboard()})
 		return err
 	}
@@ -122,7 +123,7 @@ func handlePlay(m *telegram.NewMessage, isVideo bool) error {
 
 	updater := &statusUpdater{NewMessage: statusMsg, lastMessage: lang.GetString(langCode, "play_searching"), lastSent: time.Now()}
 
-	if isReply && isValidMedia(rMsg) {
+	if hasMedia {
 		return handleMedia(m, updater, rMsg, chatID, isVideo, langCode)
 	}
 
@@ -179,11 +180,11 @@ func handleMedia(m *telegram.NewMessage, updater *statusUpdater, dlMsg *telegram
 			URL: dlMsg.Link(), Name: fileName, User: m.Sender.FirstName, TrackID: fileId,
 			Duration: dur, IsVideo: isVideo, Platform: cache.Telegram,
 		}
-		queue := cache.ChatCache.GetQueue(chatId)
+		queueLen := cache.ChatCache.GetQueueLength(chatId)
 		cache.ChatCache.AddSong(chatId, &saveCache)
 		queueInfo := fmt.Sprintf(
 			lang.GetString(langCode, "play_added_to_queue"),
-			len(queue), saveCache.URL, saveCache.Name, cache.SecToMin(saveCache.Duration), saveCache.User,
+			queueLen, saveCache.URL, saveCache.Name, cache.SecToMin(saveCache.Duration), saveCache.User,
 		)
 		_, err := updater.Edit(queueInfo, telegram.SendOptions{ReplyMarkup: core.ControlButtons("play")})
 		if err != nil {
@@ -253,11 +254,11 @@ func handleSingleTrack(m *telegram.NewMessage, updater *statusUpdater, song cach
 	}
 
 	if cache.ChatCache.IsActive(chatId) {
-		queue := cache.ChatCache.GetQueue(chatId)
+		queueLen := cache.ChatCache.GetQueueLength(chatId)
 		cache.ChatCache.AddSong(chatId, &saveCache)
 		queueInfo := fmt.Sprintf(
 			lang.GetString(langCode, "play_added_to_queue"),
-			len(queue), saveCache.URL, saveCache.Name, cache.SecToMin(saveCache.Duration), saveCache.User,
+			queueLen, saveCache.URL, saveCache.Name, cache.SecToMin(saveCache.Duration), saveCache.User,
 		)
 		_, err := updater.Edit(queueInfo, telegram.SendOptions{ReplyMarkup: core.ControlButtons("play")})
 		if err != nil {
@@ -311,12 +312,12 @@ func handleSingleTrack(m *telegram.NewMessage, updater *statusUpdater, song cach
 // handleMultipleTracks handles multiple tracks.
 func handleMultipleTracks(m *telegram.NewMessage, updater *statusUpdater, tracks []cache.MusicTrack, chatId int64, isVideo bool, langCode string) error {
 	isActive := cache.ChatCache.IsActive(chatId)
-	queue := cache.ChatCache.GetQueue(chatId)
+	queueLen := cache.ChatCache.GetQueueLength(chatId)
 	queueHeader := lang.GetString(langCode, "play_added_to_queue_header")
 	var queueItems []string
 
 	for i, track := range tracks {
-		position := len(queue) + i
+		position := queueLen + i
 		saveCache := cache.CachedTrack{
 			Name: track.Name, TrackID: track.ID, Duration: track.Duration,
 			Thumbnail: track.Cover, User: m.Sender.FirstName, Platform: track.Platform,
@@ -336,7 +337,7 @@ func handleMultipleTracks(m *telegram.NewMessage, updater *statusUpdater, tracks
 
 	queueSummary := fmt.Sprintf(
 		lang.GetString(langCode, "play_queue_summary"),
-		len(cache.ChatCache.GetQueue(chatId)), cache.SecToMin(totalDuration), m.Sender.FirstName,
+		cache.ChatCache.GetQueueLength(chatId), cache.SecToMin(totalDuration), m.Sender.FirstName,
 	)
 	fullMessage := queueHeader + strings.Join(queueItems, "\n") + queueSummary
 	if len(fullMessage) > 4096 {
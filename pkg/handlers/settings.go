@@ -21,20 +21,12 @@ func settingsHandler(m *telegram.NewMessage) error {
 	defer cancel()
 
 	chatID, _ := getPeerId(m.Client, m.ChatID())
-	admins, err := cache.GetAdmins(m.Client, chatID, false)
+	// Check if user is admin
+	admin, err := cache.LookupAdmin(m.Client, chatID, m.Sender.ID)
 	if err != nil {
 		return err
 	}
-
-	// Check if user is admin
-	var isAdmin bool
-	for _, admin := range admins {
-		if admin.User.ID == m.Sender.ID {
-			isAdmin = true
-			break
-		}
-	}
-	if !isAdmin {
+	if admin == nil {
 		return nil
 	}
 	langCode := db.Instance.GetLang(ctx, chatID)
@@ -52,6 +44,10 @@ func settingsHandler(m *telegram.NewMessage) error {
 }
 
 func settingsCallbackHandler(c *telegram.CallbackQuery) error {
+	if c.IsPrivate() {
+		return nil
+	}
+
 	chatID, err := getPeerId(c.Client, c.ChatID)
 	if err != nil {
 		gologging.WarnF("getPeerId error: %v", err)
@@ -62,21 +58,15 @@ func settingsCallbackHandler(c *telegram.CallbackQuery) error {
 	langCode := db.Instance.GetLang(ctx, chatID)
 
 	// Check admin permissions
-	admins, err := cache.GetAdmins(c.Client, chatID, false)
+	admin, err := cache.LookupAdmin(c.Client, chatID, c.Sender.ID)
 	if err != nil {
 		return err
 	}
 
-	var hasPerms bool
-	for _, admin := range admins {
-		if admin.User.ID == c.Sender.ID {
-			hasPerms = (admin.Rights != nil && admin.Rights.ManageCall) || admin.Status == telegram.Creator
-			break
-		}
-	}
+	hasPerms := admin != nil && ((admin.Rights != nil && admin.Rights.ManageCall) || admin.Status == telegram.Creator)
 
 	if !hasPerms {
-		_, err := c.Answer(lang.GetString(langCode, "settings_no_permission"), &telegram.CallbackOptions{Alert: true})
+		_, err := c.Answer(lang.GetString(langCode, "settings_no_permission"), alertOpts)
 		return err
 	}
 
@@ -98,7 +88,7 @@ func settingsCallbackHandler(c *telegram.CallbackQuery) error {
 	}
 
 	if !validValues[settingValue] {
-		_, _ = c.Answer(lang.GetString(langCode, "settings_update_invalid"), &telegram.CallbackOptions{Alert: true})
+		_, _ = c.Answer(lang.GetString(langCode, "settings_update_invalid"), alertOpts)
 		return nil
 	}
 
@@ -108,7 +98,7 @@ func settingsCallbackHandler(c *telegram.CallbackQuery) error {
 	case "admin":
 		_ = db.Instance.SetAdminMode(ctx, chatID, settingValue)
 	default:
-		_, _ = c.Answer(lang.GetString(langCode, "settings_update_prompt"), &telegram.CallbackOptions{Alert: true})
+		_, _ = c.Answer(lang.GetString(langCode, "settings_update_prompt"), alertOpts)
 		return nil
 	}
 
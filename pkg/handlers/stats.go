@@ -134,8 +134,8 @@ func sysStatsHandler(msg *telegram.NewMessage) error {
 		return nil
 	}
 
-	chats, _ := db.Instance.GetAllChats(ctx)
-	users, _ := db.Instance.GetAllUsers(ctx)
+	chats, _ := db.Instance.CountChats(ctx)
+	users, _ := db.Instance.CountUsers(ctx)
 
 	var sb strings.Builder
 	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_header"), msg.Client.Me().FirstName))
@@ -151,7 +151,7 @@ func sysStatsHandler(msg *telegram.NewMessage) error {
 		sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_mem"), info.MemUsed, info.MemPerc))
 	}
 	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_goroutines"), info.NumGoroutines))
-	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_db"), len(chats), len(users)))
+	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_db"), chats, users))
 	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_go_version"), info.GoVersion))
 	sb.WriteString(fmt.Sprintf(lang.GetString(langCode, "stats_platform"), info.OS, info.Arch))
 
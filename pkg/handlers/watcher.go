@@ -18,26 +18,33 @@ import (
 // It takes a telegram.Update object and a telegram client as input.
 // It returns an error if any.
 func handleVoiceChat(upd telegram.Update, c *telegram.Client) error {
-	switch update := upd.(type) {
-	case *telegram.UpdateNewChannelMessage:
-		if msg, ok := update.Message.(*telegram.MessageService); ok {
-			chatID, _ := getPeerId(c, msg.PeerID)
-			ctx, cancel := db.Ctx()
-			defer cancel()
-			langCode := db.Instance.GetLang(ctx, chatID)
-			if action, ok := msg.Action.(*telegram.MessageActionGroupCall); ok {
-				if action.Duration == 0 {
-					cache.ChatCache.ClearChat(chatID, true)
-					_, _ = c.SendMessage(chatID, lang.GetString(langCode, "watcher_vc_started"))
-				} else {
-					log.Printf("Voice chat ended. Duration: %d seconds", action.Duration)
-					cache.ChatCache.ClearChat(chatID, true)
-					_, _ = c.SendMessage(chatID, lang.GetString(langCode, "watcher_vc_ended"))
-				}
-			} else {
-				log.Printf("Unhandled action type: %T", msg.Action)
-			}
-		}
+	update, ok := upd.(*telegram.UpdateNewChannelMessage)
+	if !ok {
+		return nil
+	}
+	// This handler sees every channel message, so ordinary messages and unrelated service actions
+	// are dropped before any peer resolution or database work.
+	msg, ok := update.Message.(*telegram.MessageService)
+	if !ok {
+		return nil
+	}
+	action, ok := msg.Action.(*telegram.MessageActionGroupCall)
+	if !ok {
+		gologging.DebugF("Unhandled action type: %T", msg.Action)
+		return nil
+	}
+
+	chatID, _ := getPeerId(c, msg.PeerID)
+	ctx, cancel := db.Ctx()
+	defer cancel()
+	langCode := db.Instance.GetLang(ctx, chatID)
+	if action.Duration == 0 {
+		cache.ChatCache.ClearChat(chatID, true)
+		_, _ = c.SendMessage(chatID, lang.GetString(langCode, "watcher_vc_started"))
+	} else {
+		log.Printf("Voice chat ended. Duration: %d seconds", action.Duration)
+		cache.ChatCache.ClearChat(chatID, true)
+		_, _ = c.SendMessage(chatID, lang.GetString(langCode, "watcher_vc_ended"))
 	}
 	return nil
 }
@@ -89,6 +96,11 @@ func handleParticipant(pu *telegram.ParticipantUpdate) error {
 	newStatus := getStatusFromParticipant(pu.New)
 
 	gologging.DebugF("[handleParticipant] old=%s new=%s chat=%d user=%d", oldStatus, newStatus, chatID, userID)
+	if isAdminStatus(oldStatus) || isAdminStatus(newStatus) {
+		// Someone gained or lost admin rights, so the cached admin list of this chat is stale.
+		cache.ClearAdminCache(chatID)
+	}
+
 	call, err := vc.Calls.GetGroupAssistant(chatID)
 	if err != nil {
 		gologging.ErrorF("[handleParticipant] Failed to get group assistant: %v", err)
@@ -244,6 +256,11 @@ func handlePromotionDemotion(client *telegram.Client, chatID, userID int64, oldS
 	return nil
 }
 
+// isAdminStatus reports whether a participant status grants administrator rights.
+func isAdminStatus(status string) bool {
+	return status == telegram.Admin || status == telegram.Creator
+}
+
 // getStatusFromParticipant gets the status from a participant.
 // It takes a telegram.ChannelParticipant object as input.
 // It returns the status of the participant as a string.
@@ -10,12 +10,16 @@ import (
 "github.com/zuchzub/Go/pkg/vc/ntgcalls"
 	"path/filepath"
 	"regexp"
+	"strconv"
 	"strings"
 
 	"github.com/Laky-64/gologging"
 	"github.com/amarnathcjd/gogram/telegram"
 )
 
+// tgLinkRegex matches Telegram message links that DownloadTrack may return in place of a file path.
+var tgLinkRegex = regexp.MustCompile(`t\.me/(\w+)/(\d+)`)
+
 // getMediaDescription creates a media description for ntgcalls based on the provided file path, video status, and ffmpeg parameters.
 func getMediaDescription(filePath string, isVideo bool, ffmpegParameters string) ntgcalls.MediaDescription {
 	audioDescription := &ntgcalls.AudioDescription{
@@ -25,7 +29,7 @@ func getMediaDescription(filePath string, isVideo bool, ffmpegParameters string)
 	}
 
 	quotedPath := fmt.Sprintf("\"%s\"", filePath)
-	isURL := regexp.MustCompile(`^https?://`).MatchString(filePath)
+	isURL := urlRegex.MatchString(filePath)
 
 	var audioCmd strings.Builder
 	audioCmd.WriteString("ffmpeg ")
@@ -160,8 +164,7 @@ func DownloadSong(ctx context.Context, song *cache.CachedTrack, bot *telegram.Cl
 		}
 
 		filePath, err := wrapper.DownloadTrack(ctx, trackInfo, song.IsVideo)
-		reg := regexp.MustCompile(`t\.me/(\w+)/(\d+)`)
-		if match := reg.FindStringSubmatch(filePath); match != nil {
+		if match := tgLinkRegex.FindStringSubmatch(filePath); match != nil {
 			msg, err := dl.GetMessage(bot, filePath)
 			if err != nil {
 				return "", &trackInfo, fmt.Errorf("failed to get the message for %s: %w", trackInfo.Name, err)
@@ -186,17 +189,25 @@ func DownloadSong(ctx context.Context, song *cache.CachedTrack, bot *telegram.Cl
 	return "", nil, fmt.Errorf("the provided song URL is invalid: %s", songUrl)
 }
 
+// statusKey returns the statusCache key for a user in a chat.
+func statusKey(chatID, userID int64) string {
+	return strconv.FormatInt(chatID, 10) + ":" + strconv.FormatInt(userID, 10)
+}
+
+// inviteKey returns the inviteCache key for a chat.
+func inviteKey(chatID int64) string {
+	return strconv.FormatInt(chatID, 10)
+}
+
 // UpdateMembership updates the membership status of a user in a specific chat.
 func (c *TelegramCalls) UpdateMembership(chatId, userId int64, status string) {
-	cacheKey := fmt.Sprintf("%d:%d", chatId, userId)
 	if c.statusCache != nil {
-		c.statusCache.Set(cacheKey, status)
+		c.statusCache.Set(statusKey(chatId, userId), status)
 		gologging.InfoF("[UpdateMembership] The cache has been updated: chat=%d user=%d status=%s", chatId, userId, status)
 	}
 }
 
 // UpdateInviteLink updates the invite link for a specific chat.
 func (c *TelegramCalls) UpdateInviteLink(chatId int64, link string) {
-	cacheKey := fmt.Sprintf("%d", chatId)
-	c.inviteCache.Set(cacheKey, link)
+	c.inviteCache.Set(inviteKey(chatId), link)
 }
@@ -38,7 +38,7 @@ func (c *TelegramCalls) joinAssistant(chatID, ubID int64) error {
 		gologging.InfoF("[TelegramCalls - joinAssistant] The assistant appears to be %s. Attempting to unban and rejoin...", status)
 		botStatus, err := cache.GetUserAdmin(c.bot, chatID, c.bot.Me().ID, false)
 		if err != nil {
-			if strings.Contains(err.Error(), "is not an admin in chat") {
+			if errors.Is(err, cache.ErrNotAdmin) {
 				return fmt.Errorf(lang.GetString(langCode, "unban_fail_no_admin"), ubID)
 			}
 			gologging.WarnF("An error occurred while checking the bot's admin status: %v", err)
@@ -79,9 +79,7 @@ func (c *TelegramCalls) checkUserStats(chatId int64) (string, error) {
 	}
 
 	userId := call.App.Me().ID
-	cacheKey := fmt.Sprintf("%d:%d", chatId, userId)
-
-	if cached, ok := c.statusCache.Get(cacheKey); ok {
+	if cached, ok := c.statusCache.Get(statusKey(chatId, userId)); ok {
 		return cached, nil
 	}
 
@@ -112,9 +110,8 @@ func (c *TelegramCalls) joinUb(chatID int64) error {
 		return err
 	}
 
-	cacheKey := fmt.Sprintf("%d", chatID)
 	var link string
-	if cached, ok := c.inviteCache.Get(cacheKey); ok {
+	if cached, ok := c.inviteCache.Get(inviteKey(chatID)); ok {
 		link = cached
 	} else {
 		inviteLink, err := c.bot.GetChatInviteLink(chatID)